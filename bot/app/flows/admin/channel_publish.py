@@ -455,10 +455,12 @@ def setup(menu_controller, get_user_role):
             await _after_button_added(callback, state, lang)
             return
 
-        # Generate slug for packages (API doesn't return it)
-        for p in active:
-            if "slug" not in p:
-                p["slug"] = _slugify(p.get("name", "service"))
+        # Generate slug for packages (API doesn't return it).
+        # Копии: список пакетов из кэша ApiClient — общий, не мутируем
+        active = [
+            p if "slug" in p else {**p, "slug": _slugify(p.get("name", "service"))}
+            for p in active
+        ]
 
         text = t("admin:channel:btn_choose_service", lang)
         kb = kb_items_select(active, "slug", "name", "chp:booksvc", lang)
@@ -36,6 +36,7 @@ from bot.app.utils.api import api
 from bot.app.utils.pagination import build_nav_row
 from bot.app.utils.schedule_helper import (
     default_schedule,
+    dump_schedule,
     format_day_value,
     format_schedule_compact,
     parse_time_input,
@@ -596,7 +597,7 @@ def setup(mc, get_user_role):
             city=data["city"],
             street=data.get("street"),
             house=data.get("house"),
-            work_schedule=json.dumps(data.get("schedule", {}))
+            work_schedule=dump_schedule(data.get("schedule", {}))
         )
         
         if not location:
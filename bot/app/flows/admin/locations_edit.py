@@ -32,6 +32,7 @@ from bot.app.keyboards.schedule import (
 from bot.app.utils.api import api
 from bot.app.utils.schedule_helper import (
     default_schedule,
+    dump_schedule,
     format_day_value,
     format_schedule_compact,
     parse_time_input,
@@ -601,7 +602,7 @@ def setup(mc, get_user_role):
         if "house" in changes:
             patch_data["house"] = changes["house"]
         if "work_schedule" in changes:
-            patch_data["work_schedule"] = json.dumps(changes["work_schedule"])
+            patch_data["work_schedule"] = dump_schedule(changes["work_schedule"])
         
         if patch_data:
             result = await api.update_location(loc_id, **patch_data)
@@ -409,7 +409,8 @@ def setup(menu_controller, api):
             await callback.answer(t("admin:schovr:no_specialists", lang), show_alert=True)
             return
 
-        # Добавляем имена
+        # Добавляем имена (в копии — список из кэша api общий)
+        specialists = [dict(spec) for spec in specialists]
         for spec in specialists:
             if spec.get("display_name"):
                 spec["_display_name"] = spec["display_name"]
@@ -562,7 +563,8 @@ def setup(menu_controller, api):
             await callback.answer(t("admin:schovr:no_specialists", lang), show_alert=True)
             return
 
-        # Добавляем имена
+        # Добавляем имена (в копии — список из кэша api общий)
+        specialists = [dict(spec) for spec in specialists]
         for spec in specialists:
             if spec.get("display_name"):
                 spec["_display_name"] = spec["display_name"]
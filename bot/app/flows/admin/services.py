@@ -12,6 +12,7 @@ EDIT вынесен в services_edit.py (делегирование).
 - Escape hatch для CREATE FSM
 """
 
+import asyncio
 import logging
 import math
 
@@ -20,15 +21,15 @@ from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery, InlineKeyboardMarkup, Message
 
-from bot.app.i18n.loader import DEFAULT_LANG, t, t_all
+from bot.app.i18n.loader import CURRENT_LANG, t, t_all
+from bot.app.i18n.middleware import use_lang_middleware
 from bot.app.keyboards.admin import admin_services
 from bot.app.utils.api import api
-from bot.app.utils.state import user_lang
-
-from .services_edit import setup as setup_edit
+from bot.app.utils.callback import CallbackParts
 
 # EDIT entry point
-from .services_edit import start_service_edit
+from .services_edit import get_color_codes, start_service_edit
+from .services_edit import setup as setup_edit
 
 logger = logging.getLogger(__name__)
 PAGE_SIZE = 5
@@ -207,32 +208,20 @@ def service_skip_inline(lang: str) -> InlineKeyboardMarkup:
     ])
 
 
-def get_color_codes(lang: str) -> list[str]:
-    """Получить список кодов цветов из i18n."""
-    colors_str = t("colors:list", lang)
-    return [c.strip() for c in colors_str.split(",") if c.strip()]
-
-
 def color_picker_inline(lang: str) -> InlineKeyboardMarkup:
     """Выбор цвета услуги (создание)."""
     from aiogram.types import InlineKeyboardButton
     
-    buttons = []
-    row = []
-
-    for color_code in get_color_codes(lang):
-        emoji = t(f"color:{color_code}", lang)
-        row.append(InlineKeyboardButton(
-            text=emoji,
+    color_buttons = [
+        InlineKeyboardButton(
+            text=t(f"color:{color_code}", lang),
             callback_data=f"svc_color:{color_code}"
-        ))
-
-        if len(row) == 3:
-            buttons.append(row)
-            row = []
+        )
+        for color_code in get_color_codes(lang)
+    ]
 
-    if row:
-        buttons.append(row)
+    # По 3 цвета в ряд
+    buttons = [color_buttons[i:i + 3] for i in range(0, len(color_buttons), 3)]
 
     buttons.append([
         InlineKeyboardButton(
@@ -328,26 +317,30 @@ def build_service_view_text(svc: dict, lang: str) -> str:
 
 def setup(mc, get_user_role):
     router = Router(name="services")
-    logger.info("=== services.setup() called ===")
+    # Язык апдейта → CURRENT_LANG (один GET, только для хэндлеров этого flow)
+    use_lang_middleware(router)
+    logger.debug("=== services.setup() called ===")
 
     # ==========================================================
     # ESCAPE HATCH: Reply "Back" во время CREATE FSM
     # ==========================================================
 
-    @router.message(F.text.in_(t_all("admin:services:back")), ServiceCreate.name)
-    @router.message(F.text.in_(t_all("admin:services:back")), ServiceCreate.description)
-    @router.message(F.text.in_(t_all("admin:services:back")), ServiceCreate.duration)
-    @router.message(F.text.in_(t_all("admin:services:back")), ServiceCreate.break_min)
-    @router.message(F.text.in_(t_all("admin:services:back")), ServiceCreate.price)
-    @router.message(F.text.in_(t_all("admin:services:back")), ServiceCreate.price_5)
-    @router.message(F.text.in_(t_all("admin:services:back")), ServiceCreate.price_10)
-    @router.message(F.text.in_(t_all("admin:services:back")), ServiceCreate.color)
+    back_texts = t_all("admin:services:back")
+
+    @router.message(F.text.in_(back_texts), ServiceCreate.name)
+    @router.message(F.text.in_(back_texts), ServiceCreate.description)
+    @router.message(F.text.in_(back_texts), ServiceCreate.duration)
+    @router.message(F.text.in_(back_texts), ServiceCreate.break_min)
+    @router.message(F.text.in_(back_texts), ServiceCreate.price)
+    @router.message(F.text.in_(back_texts), ServiceCreate.price_5)
+    @router.message(F.text.in_(back_texts), ServiceCreate.price_10)
+    @router.message(F.text.in_(back_texts), ServiceCreate.color)
     async def escape_create_fsm(message: Message, state: FSMContext):
         """
         Escape hatch: Reply-кнопка "Назад" во время FSM создания.
         Очищает состояние и возвращает в меню Services.
         """
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         await state.clear()
         await mc.back_to_reply(
             message,
@@ -360,9 +353,8 @@ def setup(mc, get_user_role):
     # LIST
     # ==========================================================
 
-    async def show_list(message: Message, page: int = 0):
-        tg_id = message.from_user.id
-        lang = user_lang.get(tg_id, DEFAULT_LANG)
+    async def show_list(message: Message, lang: str, page: int = 0):
+        """Список (вход из reply-меню: lang передаёт admin_reply)."""
 
         services = await api.get_services()
         total = len(services)
@@ -378,9 +370,9 @@ def setup(mc, get_user_role):
     router.show_list = show_list
 
     @router.callback_query(F.data.startswith("svc:page:"))
-    async def list_page(callback: CallbackQuery):
-        page = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def list_page(callback: CallbackQuery, cb: CallbackParts):
+        page = int(cb[2])
+        lang = CURRENT_LANG.get()
 
         services = await api.get_services()
         total = len(services)
@@ -396,7 +388,7 @@ def setup(mc, get_user_role):
 
     @router.callback_query(F.data == "svc:list:0")
     async def list_first_page(callback: CallbackQuery):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
 
         services = await api.get_services()
         total = len(services)
@@ -412,7 +404,7 @@ def setup(mc, get_user_role):
 
     @router.callback_query(F.data == "svc:back")
     async def list_back(callback: CallbackQuery, state: FSMContext):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         await state.clear()
         await mc.back_to_reply(
             callback.message,
@@ -427,29 +419,30 @@ def setup(mc, get_user_role):
     # ==========================================================
 
     @router.callback_query(F.data.startswith("svc:view:"))
-    async def view_service(callback: CallbackQuery, state: FSMContext):
-        svc_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def view_service(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        svc_id = int(cb[2])
+        lang = CURRENT_LANG.get()
 
-        await state.clear()
-
-        service = await api.get_service(svc_id)
+        # Сброс FSM и запрос в backend — параллельно
+        _, service = await asyncio.gather(state.clear(), api.get_service(svc_id))
         if not service:
             await callback.answer(t("common:error", lang), show_alert=True)
             return
 
         text = build_service_view_text(service, lang)
         kb = service_view_inline(service, lang)
-        await mc.edit_inline(callback.message, text, kb)
-        await callback.answer()
+        await asyncio.gather(
+            mc.edit_inline(callback.message, text, kb),
+            callback.answer(),
+        )
 
     # ==========================================================
     # EDIT (delegation only)
     # ==========================================================
 
     @router.callback_query(F.data.startswith("svc:edit:"))
-    async def edit_service(callback: CallbackQuery, state: FSMContext):
-        svc_id = int(callback.data.split(":")[2])
+    async def edit_service(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        svc_id = int(cb[2])
         await start_service_edit(
             mc=mc,
             callback=callback,
@@ -462,9 +455,9 @@ def setup(mc, get_user_role):
     # ==========================================================
 
     @router.callback_query(F.data.startswith("svc:delete:"))
-    async def delete_confirm(callback: CallbackQuery):
-        svc_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def delete_confirm(callback: CallbackQuery, cb: CallbackParts):
+        svc_id = int(cb[2])
+        lang = CURRENT_LANG.get()
 
         service = await api.get_service(svc_id)
         if not service:
@@ -473,22 +466,26 @@ def setup(mc, get_user_role):
 
         text = t("admin:service:confirm_delete", lang) % service["name"]
         kb = service_delete_confirm_inline(svc_id, lang)
-        await mc.edit_inline(callback.message, text, kb)
-        await callback.answer()
+        await asyncio.gather(
+            mc.edit_inline(callback.message, text, kb),
+            callback.answer(),
+        )
 
     @router.callback_query(F.data.startswith("svc:delete_confirm:"))
-    async def delete_execute(callback: CallbackQuery):
-        svc_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def delete_execute(callback: CallbackQuery, cb: CallbackParts):
+        svc_id = int(cb[2])
+        lang = CURRENT_LANG.get()
 
         ok = await api.delete_service(svc_id)
         if not ok:
             await callback.answer(t("common:error", lang), show_alert=True)
             return
 
-        await callback.answer(t("admin:service:deleted", lang))
-
-        services = await api.get_services()
+        # Ответ на callback не ждёт загрузки обновлённого списка
+        _, services = await asyncio.gather(
+            callback.answer(t("admin:service:deleted", lang)),
+            api.get_services(),
+        )
         total = len(services)
 
         if total == 0:
@@ -503,8 +500,8 @@ def setup(mc, get_user_role):
     # CREATE
     # ==========================================================
 
-    async def start_create(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+    async def start_create(message: Message, state: FSMContext, lang: str):
+        """Старт создания (вход из reply-меню: lang передаёт admin_reply)."""
 
         await state.set_state(ServiceCreate.name)
         await state.update_data(lang=lang)
@@ -517,7 +514,7 @@ def setup(mc, get_user_role):
     # ---- name
     @router.message(ServiceCreate.name)
     async def create_name(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         name = message.text.strip()
 
         if len(name) < 2:
@@ -537,7 +534,7 @@ def setup(mc, get_user_role):
     # ---- description
     @router.callback_query(F.data == "svc_create:skip", ServiceCreate.description)
     async def skip_description(callback: CallbackQuery, state: FSMContext):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
 
         await state.update_data(description=None)
         await state.set_state(ServiceCreate.duration)
@@ -548,7 +545,7 @@ def setup(mc, get_user_role):
 
     @router.message(ServiceCreate.description)
     async def create_description(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         await state.update_data(description=message.text.strip() or None)
         await state.set_state(ServiceCreate.duration)
 
@@ -562,7 +559,7 @@ def setup(mc, get_user_role):
     # ---- duration
     @router.message(ServiceCreate.duration)
     async def create_duration(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
 
         try:
             duration = int(message.text.strip())
@@ -585,7 +582,7 @@ def setup(mc, get_user_role):
     # ---- break
     @router.callback_query(F.data == "svc_create:skip", ServiceCreate.break_min)
     async def skip_break(callback: CallbackQuery, state: FSMContext):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
 
         await state.update_data(break_min=0)
         await state.set_state(ServiceCreate.price)
@@ -596,7 +593,7 @@ def setup(mc, get_user_role):
 
     @router.message(ServiceCreate.break_min)
     async def create_break(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
 
         try:
             break_min = int(message.text.strip())
@@ -619,7 +616,7 @@ def setup(mc, get_user_role):
     # ---- price
     @router.message(ServiceCreate.price)
     async def create_price(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
 
         try:
             price = float(message.text.strip().replace(",", "."))
@@ -642,7 +639,7 @@ def setup(mc, get_user_role):
     # ---- price_5
     @router.callback_query(F.data == "svc_create:skip", ServiceCreate.price_5)
     async def skip_price_5(callback: CallbackQuery, state: FSMContext):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
 
         await state.update_data(price_5=None)
         await state.set_state(ServiceCreate.price_10)
@@ -653,7 +650,7 @@ def setup(mc, get_user_role):
 
     @router.message(ServiceCreate.price_5)
     async def create_price_5(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
 
         try:
             val = float(message.text.strip().replace(",", "."))
@@ -676,7 +673,7 @@ def setup(mc, get_user_role):
     # ---- price_10
     @router.callback_query(F.data == "svc_create:skip", ServiceCreate.price_10)
     async def skip_price_10(callback: CallbackQuery, state: FSMContext):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
 
         await state.update_data(price_10=None)
         await state.set_state(ServiceCreate.color)
@@ -687,7 +684,7 @@ def setup(mc, get_user_role):
 
     @router.message(ServiceCreate.price_10)
     async def create_price_10(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
 
         try:
             val = float(message.text.strip().replace(",", "."))
@@ -709,9 +706,9 @@ def setup(mc, get_user_role):
 
     # ---- color / save
     @router.callback_query(F.data.startswith("svc_color:"), ServiceCreate.color)
-    async def create_color(callback: CallbackQuery, state: FSMContext):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
-        color_value = callback.data.split(":")[1]
+    async def create_color(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        lang = CURRENT_LANG.get()
+        color_value = cb[1]
         color_code = None if color_value == "none" else color_value
 
         data = await state.get_data()
@@ -749,7 +746,7 @@ def setup(mc, get_user_role):
     # ---- cancel create
     @router.callback_query(F.data == "svc_create:cancel")
     async def cancel_create(callback: CallbackQuery, state: FSMContext):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         await state.clear()
         await callback.answer()
         await mc.back_to_reply(
@@ -762,5 +759,5 @@ def setup(mc, get_user_role):
     # подключаем EDIT router
     router.include_router(setup_edit(mc, get_user_role))
 
-    logger.info("=== services router configured ===")
+    logger.debug("=== services router configured ===")
     return router
@@ -12,16 +12,21 @@ EDIT-FSM for Services (admin).
 - Escape hatch для EDIT FSM states
 """
 
+import asyncio
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cache, lru_cache
 
 from aiogram import F, Router
+from aiogram.filters import StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup, Message
 
-from bot.app.i18n.loader import DEFAULT_LANG, t, t_all
+from bot.app.i18n.loader import CURRENT_LANG, get_available_langs, t, t_all
 from bot.app.utils.api import api
-from bot.app.utils.state import user_lang
+from bot.app.utils.callback import CallbackAction, CallbackParts
 
 logger = logging.getLogger(__name__)
 
@@ -42,12 +47,78 @@ class ServiceEdit(StatesGroup):
     color = State()
 
 
+# ==============================================================
+# Field input: parsers (ValueError → показать ошибку)
+# ==============================================================
+
+def _parse_name(text: str) -> str:
+    if len(text) < 2:
+        raise ValueError()
+    return text
+
+
+def _parse_description(text: str) -> str | None:
+    return text or None
+
+
+def _parse_positive_int(text: str) -> int:
+    value = int(text)
+    if value <= 0:
+        raise ValueError()
+    return value
+
+
+def _parse_non_negative_int(text: str) -> int:
+    value = int(text)
+    if value < 0:
+        raise ValueError()
+    return value
+
+
+def _parse_price(text: str) -> float:
+    value = float(text.replace(",", "."))
+    if value < 0:
+        raise ValueError()
+    return value
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """Описание текстового ввода одного поля услуги."""
+    field: str                       # ключ в changes / PATCH
+    parse: Callable[[str], object]
+    error_key: str | None = None     # i18n ключ ошибки (None — парсер не падает)
+    clear_field: str | None = None   # nullable поле → кнопка «Очистить»
+
+
+EDIT_FIELDS: dict[str, FieldSpec] = {
+    ServiceEdit.name.state: FieldSpec("name", _parse_name, "admin:service:error_name"),
+    ServiceEdit.description.state: FieldSpec("description", _parse_description),
+    ServiceEdit.duration.state: FieldSpec("duration_min", _parse_positive_int, "admin:service:error_duration"),
+    ServiceEdit.break_min.state: FieldSpec("break_min", _parse_non_negative_int, "admin:service:error_break"),
+    ServiceEdit.price.state: FieldSpec("price", _parse_price, "admin:service:error_price"),
+    ServiceEdit.price_5.state: FieldSpec("price_5", _parse_price, "admin:service:error_price", "price_5"),
+    ServiceEdit.price_10.state: FieldSpec("price_10", _parse_price, "admin:service:error_price", "price_10"),
+}
+
+
 # ==============================================================
 # Inline keyboards for EDIT
+# Клавиатуры зависят только от аргументов (svc_id, lang, ...) → кэшируются.
+# Возвращаемые объекты общие: не мутировать.
 # ==============================================================
 
-def service_edit_inline(svc_id: int, lang: str) -> InlineKeyboardMarkup:
-    """Экран редактирования услуги."""
+KB_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=KB_CACHE_SIZE)
+def service_edit_inline(svc_id: int, lang: str, has_changes: bool = False) -> InlineKeyboardMarkup:
+    """
+    Экран редактирования услуги.
+
+    Без изменений кнопка Save шлёт svc:no_changes — ответ без чтения FSM.
+    """
+    save_action = "save" if has_changes else "no_changes"
     return InlineKeyboardMarkup(inline_keyboard=[
         [
             InlineKeyboardButton(
@@ -92,7 +163,7 @@ def service_edit_inline(svc_id: int, lang: str) -> InlineKeyboardMarkup:
         [
             InlineKeyboardButton(
                 text=t("common:save", lang),
-                callback_data=f"svc:save:{svc_id}"
+                callback_data=f"svc:{save_action}:{svc_id}"
             ),
             InlineKeyboardButton(
                 text=t("common:back", lang),
@@ -102,6 +173,7 @@ def service_edit_inline(svc_id: int, lang: str) -> InlineKeyboardMarkup:
     ])
 
 
+@lru_cache(maxsize=KB_CACHE_SIZE)
 def service_edit_cancel_inline(svc_id: int, lang: str) -> InlineKeyboardMarkup:
     """Кнопка отмены при редактировании поля."""
     return InlineKeyboardMarkup(inline_keyboard=[[
@@ -112,6 +184,7 @@ def service_edit_cancel_inline(svc_id: int, lang: str) -> InlineKeyboardMarkup:
     ]])
 
 
+@lru_cache(maxsize=KB_CACHE_SIZE)
 def service_edit_clear_cancel_inline(svc_id: int, field: str, lang: str) -> InlineKeyboardMarkup:
     """Кнопки Очистить + Отмена для nullable полей (description, price_5, price_10)."""
     return InlineKeyboardMarkup(inline_keyboard=[
@@ -126,31 +199,27 @@ def service_edit_clear_cancel_inline(svc_id: int, field: str, lang: str) -> Inli
     ])
 
 
-# Коды цветов берутся из i18n
-def get_color_codes(lang: str) -> list[str]:
+# Коды цветов берутся из i18n (тексты загружаются один раз при старте)
+@cache
+def get_color_codes(lang: str) -> tuple[str, ...]:
     """Получить список кодов цветов из i18n."""
     colors_str = t("colors:list", lang)
-    return [c.strip() for c in colors_str.split(",") if c.strip()]
+    return tuple(c.strip() for c in colors_str.split(",") if c.strip())
 
 
+@lru_cache(maxsize=KB_CACHE_SIZE)
 def color_picker_edit_inline(svc_id: int, lang: str) -> InlineKeyboardMarkup:
     """Выбор цвета при редактировании."""
-    buttons = []
-    row = []
-
-    for color_code in get_color_codes(lang):
-        emoji = t(f"color:{color_code}", lang)
-        row.append(InlineKeyboardButton(
-            text=emoji,
+    color_buttons = [
+        InlineKeyboardButton(
+            text=t(f"color:{color_code}", lang),
             callback_data=f"svc:color:{svc_id}:{color_code}"
-        ))
-
-        if len(row) == 3:
-            buttons.append(row)
-            row = []
+        )
+        for color_code in get_color_codes(lang)
+    ]
 
-    if row:
-        buttons.append(row)
+    # По 3 цвета в ряд
+    buttons = [color_buttons[i:i + 3] for i in range(0, len(color_buttons), 3)]
 
     # Без цвета
     buttons.append([
@@ -270,6 +339,25 @@ def _get_changed_field_names(changes: dict, lang: str) -> list[str]:
     return names
 
 
+# ==============================================================
+# Helpers: FSM
+# ==============================================================
+
+async def _apply_change(state: FSMContext, data: dict, field: str, value) -> dict:
+    """
+    Записать изменение поля в changes и выйти из режима ввода.
+
+    data уже загружен хэндлером → set_data вместо update_data (без повторного GET).
+    Данные и state лежат в разных ключах Redis — пишем параллельно.
+    """
+    changes = {**data.get("changes", {}), field: value}
+    await asyncio.gather(
+        state.set_data({**data, "changes": changes}),
+        state.set_state(None),
+    )
+    return changes
+
+
 # ==============================================================
 # Entry point (called from services.py delegate)
 # ==============================================================
@@ -282,31 +370,27 @@ async def start_service_edit(*, mc, callback: CallbackQuery, state: FSMContext,
     - обработчик svc:edit:{id} находится в services.py и просто делегирует сюда.
     - здесь только инициализация + показ edit-экрана.
     """
-    lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    lang = CURRENT_LANG.get()
 
-    service = await api.get_service(svc_id)
+    service, data = await asyncio.gather(api.get_service(svc_id), state.get_data())
     if not service:
         await callback.answer(t("common:error", lang), show_alert=True)
         return
 
-    data = await state.get_data()
-
     # Если новый вход или другой svc_id — инициализируем заново
     if data.get("edit_svc_id") != svc_id:
-        await state.update_data(
-            edit_svc_id=svc_id,
-            original=service,
-            changes={}
-        )
-        data = await state.get_data()
+        data = {**data, "edit_svc_id": svc_id, "original": service, "changes": {}}
+        await state.set_data(data)
 
     changes = data.get("changes", {})
     text = build_service_edit_text(service, changes, lang)
-    kb = service_edit_inline(svc_id, lang)
+    kb = service_edit_inline(svc_id, lang, bool(changes))
 
     # Активируем IME для режима редактирования (удалит reply-якорь)
-    await mc.edit_inline_input(callback.message, text, kb)
-    await callback.answer()
+    await asyncio.gather(
+        mc.edit_inline_input(callback.message, text, kb),
+        callback.answer(),
+    )
 
 
 # ==============================================================
@@ -320,7 +404,11 @@ def setup(mc, get_user_role):
     """
 
     router = Router(name="services_edit")
-    logger.info("=== services_edit.setup() called ===")
+    logger.debug("=== services_edit.setup() called ===")
+
+    # Прогрев кэшей до первого пользовательского callback
+    for lang in get_available_langs():
+        get_color_codes(lang)
 
     # Импортируем admin_services из keyboards (внутри setup чтобы избежать circular import)
     from bot.app.keyboards.admin import admin_services
@@ -329,17 +417,19 @@ def setup(mc, get_user_role):
     # ESCAPE HATCH: Reply "Back" во время EDIT FSM
     # ==========================================================
 
-    @router.message(F.text.in_(t_all("admin:services:back")), ServiceEdit.name)
-    @router.message(F.text.in_(t_all("admin:services:back")), ServiceEdit.description)
-    @router.message(F.text.in_(t_all("admin:services:back")), ServiceEdit.duration)
-    @router.message(F.text.in_(t_all("admin:services:back")), ServiceEdit.break_min)
-    @router.message(F.text.in_(t_all("admin:services:back")), ServiceEdit.price)
-    @router.message(F.text.in_(t_all("admin:services:back")), ServiceEdit.price_5)
-    @router.message(F.text.in_(t_all("admin:services:back")), ServiceEdit.price_10)
-    @router.message(F.text.in_(t_all("admin:services:back")), ServiceEdit.color)
+    back_texts = t_all("admin:services:back")
+
+    @router.message(F.text.in_(back_texts), ServiceEdit.name)
+    @router.message(F.text.in_(back_texts), ServiceEdit.description)
+    @router.message(F.text.in_(back_texts), ServiceEdit.duration)
+    @router.message(F.text.in_(back_texts), ServiceEdit.break_min)
+    @router.message(F.text.in_(back_texts), ServiceEdit.price)
+    @router.message(F.text.in_(back_texts), ServiceEdit.price_5)
+    @router.message(F.text.in_(back_texts), ServiceEdit.price_10)
+    @router.message(F.text.in_(back_texts), ServiceEdit.color)
     async def escape_edit_fsm(message: Message, state: FSMContext):
         """Escape hatch: Reply Back во время Edit FSM → отмена и возврат."""
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         await state.clear()
         await mc.back_to_reply(
             message,
@@ -349,110 +439,88 @@ def setup(mc, get_user_role):
         )
 
     # ==========================================================
-    # EDIT: name
+    # EDIT: text input (все поля через EDIT_FIELDS)
     # ==========================================================
 
-    @router.callback_query(F.data.startswith("svc:edit_name:"))
-    async def edit_name_start(callback: CallbackQuery, state: FSMContext):
-        svc_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
-
-        await state.set_state(ServiceEdit.name)
-
-        text = t("admin:service:enter_name", lang)
-        kb = service_edit_cancel_inline(svc_id, lang)
-
-        await mc.edit_inline_input(callback.message, text, kb)
-        await callback.answer()
-
-    @router.message(ServiceEdit.name)
-    async def edit_name_process(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
-        name = message.text.strip()
-
-        if len(name) < 2:
-            data = await state.get_data()
-            svc_id = data.get("edit_svc_id")
-            await mc.show_inline_input(message, t("admin:service:error_name", lang), service_edit_cancel_inline(svc_id, lang))
-            return
+    @router.message(StateFilter(*EDIT_FIELDS))
+    async def edit_field_process(message: Message, state: FSMContext, raw_state: str | None):
+        spec = EDIT_FIELDS[raw_state]
+        lang = CURRENT_LANG.get()
 
         data = await state.get_data()
         svc_id = data.get("edit_svc_id")
-        changes = data.get("changes", {})
-        changes["name"] = name
 
-        await state.update_data(changes=changes)
-        await state.set_state(None)
+        try:
+            value = spec.parse(message.text.strip())
+        except ValueError:
+            if spec.clear_field:
+                kb = service_edit_clear_cancel_inline(svc_id, spec.clear_field, lang)
+            else:
+                kb = service_edit_cancel_inline(svc_id, lang)
+            await mc.show_inline_input(message, t(spec.error_key, lang), kb)
+            return
+
+        changes = await _apply_change(state, data, spec.field, value)
 
         service = data.get("original", {})
         text = build_service_edit_text(service, changes, lang)
-        kb = service_edit_inline(svc_id, lang)
+        kb = service_edit_inline(svc_id, lang, bool(changes))
 
         await mc.show_inline_readonly(message, text, kb)
 
     # ==========================================================
-    # EDIT: description
+    # EDIT: name
     # ==========================================================
 
-    @router.callback_query(F.data.startswith("svc:edit_desc:"))
-    async def edit_desc_start(callback: CallbackQuery, state: FSMContext):
-        svc_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def edit_name_start(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        svc_id = int(cb[2])
+        lang = CURRENT_LANG.get()
 
-        await state.set_state(ServiceEdit.description)
+        await state.set_state(ServiceEdit.name)
 
-        text = t("admin:service:enter_description", lang)
-        kb = service_edit_clear_cancel_inline(svc_id, "desc", lang)
+        text = t("admin:service:enter_name", lang)
+        kb = service_edit_cancel_inline(svc_id, lang)
 
         await mc.edit_inline_input(callback.message, text, kb)
         await callback.answer()
 
-    @router.callback_query(F.data.startswith("svc:clear_desc:"))
-    async def clear_desc(callback: CallbackQuery, state: FSMContext):
-        svc_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    # ==========================================================
+    # EDIT: description
+    # ==========================================================
 
-        data = await state.get_data()
-        changes = data.get("changes", {})
-        changes["description"] = None
+    async def edit_desc_start(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        svc_id = int(cb[2])
+        lang = CURRENT_LANG.get()
 
-        await state.update_data(changes=changes)
-        await state.set_state(None)
+        await state.set_state(ServiceEdit.description)
 
-        service = data.get("original", {})
-        text = build_service_edit_text(service, changes, lang)
-        kb = service_edit_inline(svc_id, lang)
+        text = t("admin:service:enter_description", lang)
+        kb = service_edit_clear_cancel_inline(svc_id, "desc", lang)
 
-        await mc.edit_inline(callback.message, text, kb)
+        await mc.edit_inline_input(callback.message, text, kb)
         await callback.answer()
 
-    @router.message(ServiceEdit.description)
-    async def edit_desc_process(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
-        description = message.text.strip()
+    async def clear_desc(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        svc_id = int(cb[2])
+        lang = CURRENT_LANG.get()
 
         data = await state.get_data()
-        svc_id = data.get("edit_svc_id")
-        changes = data.get("changes", {})
-        changes["description"] = description if description else None
-
-        await state.update_data(changes=changes)
-        await state.set_state(None)
+        changes = await _apply_change(state, data, "description", None)
 
         service = data.get("original", {})
         text = build_service_edit_text(service, changes, lang)
-        kb = service_edit_inline(svc_id, lang)
+        kb = service_edit_inline(svc_id, lang, bool(changes))
 
-        await mc.show_inline_readonly(message, text, kb)
+        await mc.edit_inline(callback.message, text, kb)
+        await callback.answer()
 
     # ==========================================================
     # EDIT: duration
     # ==========================================================
 
-    @router.callback_query(F.data.startswith("svc:edit_duration:"))
-    async def edit_duration_start(callback: CallbackQuery, state: FSMContext):
-        svc_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def edit_duration_start(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        svc_id = int(cb[2])
+        lang = CURRENT_LANG.get()
 
         await state.set_state(ServiceEdit.duration)
 
@@ -462,42 +530,13 @@ def setup(mc, get_user_role):
         await mc.edit_inline_input(callback.message, text, kb)
         await callback.answer()
 
-    @router.message(ServiceEdit.duration)
-    async def edit_duration_process(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
-
-        try:
-            duration = int(message.text.strip())
-            if duration <= 0:
-                raise ValueError()
-        except ValueError:
-            data = await state.get_data()
-            svc_id = data.get("edit_svc_id")
-            await mc.show_inline_input(message, t("admin:service:error_duration", lang), service_edit_cancel_inline(svc_id, lang))
-            return
-
-        data = await state.get_data()
-        svc_id = data.get("edit_svc_id")
-        changes = data.get("changes", {})
-        changes["duration_min"] = duration
-
-        await state.update_data(changes=changes)
-        await state.set_state(None)
-
-        service = data.get("original", {})
-        text = build_service_edit_text(service, changes, lang)
-        kb = service_edit_inline(svc_id, lang)
-
-        await mc.show_inline_readonly(message, text, kb)
-
     # ==========================================================
     # EDIT: break_min
     # ==========================================================
 
-    @router.callback_query(F.data.startswith("svc:edit_break:"))
-    async def edit_break_start(callback: CallbackQuery, state: FSMContext):
-        svc_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def edit_break_start(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        svc_id = int(cb[2])
+        lang = CURRENT_LANG.get()
 
         await state.set_state(ServiceEdit.break_min)
 
@@ -507,42 +546,13 @@ def setup(mc, get_user_role):
         await mc.edit_inline_input(callback.message, text, kb)
         await callback.answer()
 
-    @router.message(ServiceEdit.break_min)
-    async def edit_break_process(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
-
-        try:
-            break_min = int(message.text.strip())
-            if break_min < 0:
-                raise ValueError()
-        except ValueError:
-            data = await state.get_data()
-            svc_id = data.get("edit_svc_id")
-            await mc.show_inline_input(message, t("admin:service:error_break", lang), service_edit_cancel_inline(svc_id, lang))
-            return
-
-        data = await state.get_data()
-        svc_id = data.get("edit_svc_id")
-        changes = data.get("changes", {})
-        changes["break_min"] = break_min
-
-        await state.update_data(changes=changes)
-        await state.set_state(None)
-
-        service = data.get("original", {})
-        text = build_service_edit_text(service, changes, lang)
-        kb = service_edit_inline(svc_id, lang)
-
-        await mc.show_inline_readonly(message, text, kb)
-
     # ==========================================================
     # EDIT: price
     # ==========================================================
 
-    @router.callback_query(F.data.startswith("svc:edit_price:"))
-    async def edit_price_start(callback: CallbackQuery, state: FSMContext):
-        svc_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def edit_price_start(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        svc_id = int(cb[2])
+        lang = CURRENT_LANG.get()
 
         await state.set_state(ServiceEdit.price)
 
@@ -552,43 +562,13 @@ def setup(mc, get_user_role):
         await mc.edit_inline_input(callback.message, text, kb)
         await callback.answer()
 
-    @router.message(ServiceEdit.price)
-    async def edit_price_process(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
-
-        try:
-            price_text = message.text.strip().replace(",", ".")
-            price = float(price_text)
-            if price < 0:
-                raise ValueError()
-        except ValueError:
-            data = await state.get_data()
-            svc_id = data.get("edit_svc_id")
-            await mc.show_inline_input(message, t("admin:service:error_price", lang), service_edit_cancel_inline(svc_id, lang))
-            return
-
-        data = await state.get_data()
-        svc_id = data.get("edit_svc_id")
-        changes = data.get("changes", {})
-        changes["price"] = price
-
-        await state.update_data(changes=changes)
-        await state.set_state(None)
-
-        service = data.get("original", {})
-        text = build_service_edit_text(service, changes, lang)
-        kb = service_edit_inline(svc_id, lang)
-
-        await mc.show_inline_readonly(message, text, kb)
-
     # ==========================================================
     # EDIT: price_5
     # ==========================================================
 
-    @router.callback_query(F.data.startswith("svc:edit_price_5:"))
-    async def edit_price_5_start(callback: CallbackQuery, state: FSMContext):
-        svc_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def edit_price_5_start(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        svc_id = int(cb[2])
+        lang = CURRENT_LANG.get()
 
         await state.set_state(ServiceEdit.price_5)
 
@@ -598,61 +578,27 @@ def setup(mc, get_user_role):
         await mc.edit_inline_input(callback.message, text, kb)
         await callback.answer()
 
-    @router.callback_query(F.data.startswith("svc:clear_price_5:"))
-    async def clear_price_5(callback: CallbackQuery, state: FSMContext):
-        svc_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def clear_price_5(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        svc_id = int(cb[2])
+        lang = CURRENT_LANG.get()
 
         data = await state.get_data()
-        changes = data.get("changes", {})
-        changes["price_5"] = None
-
-        await state.update_data(changes=changes)
-        await state.set_state(None)
+        changes = await _apply_change(state, data, "price_5", None)
 
         service = data.get("original", {})
         text = build_service_edit_text(service, changes, lang)
-        kb = service_edit_inline(svc_id, lang)
+        kb = service_edit_inline(svc_id, lang, bool(changes))
 
         await mc.edit_inline(callback.message, text, kb)
         await callback.answer()
 
-    @router.message(ServiceEdit.price_5)
-    async def edit_price_5_process(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
-
-        try:
-            val = float(message.text.strip().replace(",", "."))
-            if val < 0:
-                raise ValueError()
-        except ValueError:
-            data = await state.get_data()
-            svc_id = data.get("edit_svc_id")
-            await mc.show_inline_input(message, t("admin:service:error_price", lang), service_edit_clear_cancel_inline(svc_id, "price_5", lang))
-            return
-
-        data = await state.get_data()
-        svc_id = data.get("edit_svc_id")
-        changes = data.get("changes", {})
-        changes["price_5"] = val
-
-        await state.update_data(changes=changes)
-        await state.set_state(None)
-
-        service = data.get("original", {})
-        text = build_service_edit_text(service, changes, lang)
-        kb = service_edit_inline(svc_id, lang)
-
-        await mc.show_inline_readonly(message, text, kb)
-
     # ==========================================================
     # EDIT: price_10
     # ==========================================================
 
-    @router.callback_query(F.data.startswith("svc:edit_price_10:"))
-    async def edit_price_10_start(callback: CallbackQuery, state: FSMContext):
-        svc_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def edit_price_10_start(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        svc_id = int(cb[2])
+        lang = CURRENT_LANG.get()
 
         await state.set_state(ServiceEdit.price_10)
 
@@ -662,61 +608,27 @@ def setup(mc, get_user_role):
         await mc.edit_inline_input(callback.message, text, kb)
         await callback.answer()
 
-    @router.callback_query(F.data.startswith("svc:clear_price_10:"))
-    async def clear_price_10(callback: CallbackQuery, state: FSMContext):
-        svc_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def clear_price_10(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        svc_id = int(cb[2])
+        lang = CURRENT_LANG.get()
 
         data = await state.get_data()
-        changes = data.get("changes", {})
-        changes["price_10"] = None
-
-        await state.update_data(changes=changes)
-        await state.set_state(None)
+        changes = await _apply_change(state, data, "price_10", None)
 
         service = data.get("original", {})
         text = build_service_edit_text(service, changes, lang)
-        kb = service_edit_inline(svc_id, lang)
+        kb = service_edit_inline(svc_id, lang, bool(changes))
 
         await mc.edit_inline(callback.message, text, kb)
         await callback.answer()
 
-    @router.message(ServiceEdit.price_10)
-    async def edit_price_10_process(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
-
-        try:
-            val = float(message.text.strip().replace(",", "."))
-            if val < 0:
-                raise ValueError()
-        except ValueError:
-            data = await state.get_data()
-            svc_id = data.get("edit_svc_id")
-            await mc.show_inline_input(message, t("admin:service:error_price", lang), service_edit_clear_cancel_inline(svc_id, "price_10", lang))
-            return
-
-        data = await state.get_data()
-        svc_id = data.get("edit_svc_id")
-        changes = data.get("changes", {})
-        changes["price_10"] = val
-
-        await state.update_data(changes=changes)
-        await state.set_state(None)
-
-        service = data.get("original", {})
-        text = build_service_edit_text(service, changes, lang)
-        kb = service_edit_inline(svc_id, lang)
-
-        await mc.show_inline_readonly(message, text, kb)
-
     # ==========================================================
     # EDIT: color
     # ==========================================================
 
-    @router.callback_query(F.data.startswith("svc:edit_color:"))
-    async def edit_color_start(callback: CallbackQuery, state: FSMContext):
-        svc_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def edit_color_start(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        svc_id = int(cb[2])
+        lang = CURRENT_LANG.get()
 
         await state.set_state(ServiceEdit.color)
 
@@ -728,24 +640,19 @@ def setup(mc, get_user_role):
         await callback.answer()
 
     @router.callback_query(F.data.startswith("svc:color:"), ServiceEdit.color)
-    async def edit_color_process(callback: CallbackQuery, state: FSMContext):
-        parts = callback.data.split(":")
-        svc_id = int(parts[2])
-        color_value = parts[3]
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def edit_color_process(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        svc_id = int(cb[2])
+        color_value = cb[3]
+        lang = CURRENT_LANG.get()
 
         color_code = None if color_value == "none" else color_value
 
         data = await state.get_data()
-        changes = data.get("changes", {})
-        changes["color_code"] = color_code
-
-        await state.update_data(changes=changes)
-        await state.set_state(None)
+        changes = await _apply_change(state, data, "color_code", color_code)
 
         service = data.get("original", {})
         text = build_service_edit_text(service, changes, lang)
-        kb = service_edit_inline(svc_id, lang)
+        kb = service_edit_inline(svc_id, lang, bool(changes))
 
         await mc.edit_inline(callback.message, text, kb)
         await callback.answer()
@@ -754,10 +661,13 @@ def setup(mc, get_user_role):
     # SAVE: применить все изменения
     # ==========================================================
 
-    @router.callback_query(F.data.startswith("svc:save:"))
-    async def save_service(callback: CallbackQuery, state: FSMContext):
-        svc_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def no_changes(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        # Клавиатура отрисована без изменений — FSM не читаем
+        await callback.answer(t("admin:service:no_changes", CURRENT_LANG.get()))
+
+    async def save_service(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        svc_id = int(cb[2])
+        lang = CURRENT_LANG.get()
 
         data = await state.get_data()
         changes = data.get("changes", {})
@@ -784,6 +694,30 @@ def setup(mc, get_user_role):
             kb = service_view_inline(service, lang)
             await mc.edit_inline(callback.message, text, kb)
 
-    logger.info("=== services_edit router configured ===")
+    # ==========================================================
+    # DISPATCH: svc:<action>:<svc_id> → handler (один фильтр на все)
+    # ==========================================================
+
+    edit_routes = {
+        "edit_name": edit_name_start,
+        "edit_desc": edit_desc_start,
+        "clear_desc": clear_desc,
+        "edit_duration": edit_duration_start,
+        "edit_break": edit_break_start,
+        "edit_price": edit_price_start,
+        "edit_price_5": edit_price_5_start,
+        "clear_price_5": clear_price_5,
+        "edit_price_10": edit_price_10_start,
+        "clear_price_10": clear_price_10,
+        "edit_color": edit_color_start,
+        "save": save_service,
+        "no_changes": no_changes,
+    }
+
+    @router.callback_query(CallbackAction("svc", *edit_routes))
+    async def edit_dispatch(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        await edit_routes[cb[1]](callback, state, cb)
+
+    logger.debug("=== services_edit router configured ===")
     return router
 
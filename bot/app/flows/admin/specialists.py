@@ -12,11 +12,15 @@ EDIT вынесен в specialists_edit.py (делегирование).
 - делегирование EDIT
 """
 
-import json
+import asyncio
 import logging
-import math
+import time
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Final
 
 from aiogram import F, Router
+from aiogram.filters import StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import (
@@ -26,21 +30,27 @@ from aiogram.types import (
     Message,
 )
 
-from bot.app.i18n.loader import DEFAULT_LANG, t, t_all
+from bot.app.i18n.loader import CURRENT_LANG, t, t_all
+from bot.app.i18n.middleware import use_lang_middleware
 from bot.app.keyboards.admin import admin_specialists
 from bot.app.keyboards.schedule import (
     schedule_day_edit_inline,
     schedule_days_inline,
 )
 from bot.app.utils.api import api
+from bot.app.utils.callback import CallbackAction, CallbackParts
+from bot.app.utils.formatters import user_full_name
+from bot.app.utils.locks import user_locks
 from bot.app.utils.pagination import build_nav_row
 from bot.app.utils.schedule_helper import (
+    DAYS,
     default_schedule,  # noqa: F401
+    dump_schedule,
     format_day_value,
     format_schedule_compact,
+    parse_schedule,
     parse_time_input,
 )
-from bot.app.utils.state import user_lang
 
 from .specialists_edit import setup as setup_edit
 
@@ -56,6 +66,17 @@ logger = logging.getLogger(__name__)
 PAGE_SIZE = 5
 USER_SORT_BY = "name"  # "name" | "phone"
 
+# Сколько секунд повторный тап по «Удалить» того же специалиста не шлёт DELETE
+DELETE_DEDUP_TTL = 30.0
+
+_GET_USER_ID = itemgetter("user_id")
+
+# Дефолтный график специалиста: Пн-Пт 10:00-19:00 (только чтение, копии — через _specialist_default_schedule)
+_DEFAULT_WORK_SCHEDULE: Final = MappingProxyType({
+    day: (None if day in ("sat", "sun") else MappingProxyType({"start": "10:00", "end": "19:00"}))
+    for day in DAYS
+})
+
 
 # ==============================================================
 # FSM: CREATE
@@ -103,59 +124,60 @@ def specialist_skip_inline(lang: str) -> InlineKeyboardMarkup:
     ])
 
 
+def _user_item_text(user: dict, lang: str) -> str:
+    """Текст кнопки пользователя: имя и телефон, если есть."""
+    name = user_full_name(user)
+    phone = user.get("phone") or ""
+    if phone:
+        return t("admin:specialist:user_item", lang) % (name, phone)
+    return f"👤 {name}"
+
+
+def _specialist_list_name(spec: dict, users_map: dict[int, dict]) -> str:
+    """display_name специалиста или имя из user."""
+    name = spec.get("display_name")
+    if name:
+        return name
+    user = users_map.get(spec["user_id"])
+    return user_full_name(user) if user else f"ID:{spec['user_id']}"
+
+
 def users_select_inline(
-    users: list[dict],
-    existing_specialist_user_ids: set[int],
+    available_users: list[dict],
     lang: str,
     page: int = 0
 ) -> InlineKeyboardMarkup:
     """
     Выбор пользователя при создании специалиста.
-    Фильтрует уже назначенных специалистами.
+    available_users уже отфильтрован и отсортирован (sort_available_users).
     """
-    # Фильтруем пользователей которые уже специалисты
-    available_users = [u for u in users if u["id"] not in existing_specialist_user_ids]
-    
-    # Сортировка
-    if USER_SORT_BY == "phone":
-        available_users.sort(key=lambda u: u.get("phone") or "")
-    else:
-        available_users.sort(key=lambda u: _get_user_full_name(u))
-    
     total = len(available_users)
-    total_pages = max(1, math.ceil(total / PAGE_SIZE))
+    total_pages = max(1, (total + PAGE_SIZE - 1) // PAGE_SIZE)
     page = max(0, min(page, total_pages - 1))
     
     start = page * PAGE_SIZE
     end = start + PAGE_SIZE
     page_items = available_users[start:end]
     
-    buttons = []
-    
     # Кнопка поиска
-    buttons.append([
+    buttons = [[
         InlineKeyboardButton(
             text=t("admin:specialist:search_phone", lang),
             callback_data="spec_create:search"
         )
-    ])
+    ]]
     
     # Кнопки пользователей
-    for user in page_items:
-        name = _get_user_full_name(user)
-        phone = user.get("phone") or ""
-        
-        if phone:
-            text = t("admin:specialist:user_item", lang) % (name, phone)
-        else:
-            text = f"👤 {name}"
-        
-        buttons.append([
+    user_cb = "spec_create:user:"
+    buttons += [
+        [
             InlineKeyboardButton(
-                text=text,
-                callback_data=f"spec_create:user:{user['id']}"
+                text=_user_item_text(user, lang),
+                callback_data=user_cb + str(user["id"])
             )
-        ])
+        ]
+        for user in page_items
+    ]
     
     # Пагинация
     nav = build_nav_row(page, total_pages, "spec_create:user_page:{p}", "spec_create:noop", lang)
@@ -203,24 +225,23 @@ def services_multiselect_inline(
     ✅ — выбрана, ⬜ — не выбрана.
     """
     total = len(services)
-    total_pages = max(1, math.ceil(total / PAGE_SIZE))
+    total_pages = max(1, (total + PAGE_SIZE - 1) // PAGE_SIZE)
     page = max(0, min(page, total_pages - 1))
     
     start = page * PAGE_SIZE
     end = start + PAGE_SIZE
     page_items = services[start:end]
     
-    buttons = []
-    
-    for svc in page_items:
-        is_selected = svc["id"] in selected_ids
-        icon = "✅" if is_selected else "⬜"
-        buttons.append([
+    toggle_cb = f"{prefix}:svc_toggle:"
+    buttons = [
+        [
             InlineKeyboardButton(
-                text=f"{icon} {svc['name']}",
-                callback_data=f"{prefix}:svc_toggle:{svc['id']}"
+                text=f"{'✅' if svc['id'] in selected_ids else '⬜'} {svc['name']}",
+                callback_data=toggle_cb + str(svc["id"])
             )
-        ])
+        ]
+        for svc in page_items
+    ]
     
     # Пагинация
     nav = build_nav_row(page, total_pages, f"{prefix}:svc_page:{{p}}", f"{prefix}:noop", lang)
@@ -256,29 +277,23 @@ def specialists_list_inline(
 ) -> InlineKeyboardMarkup:
     """Список специалистов с пагинацией."""
     total = len(specialists)
-    total_pages = max(1, math.ceil(total / PAGE_SIZE))
+    total_pages = max(1, (total + PAGE_SIZE - 1) // PAGE_SIZE)
     page = max(0, min(page, total_pages - 1))
     
     start = page * PAGE_SIZE
     end = start + PAGE_SIZE
     page_items = specialists[start:end]
     
-    buttons = []
-    
-    for spec in page_items:
-        # Берём display_name или имя из user
-        name = spec.get("display_name")
-        if not name:
-            user = users_map.get(spec["user_id"], {})
-            name = _get_user_full_name(user) if user else f"ID:{spec['user_id']}"
-        
-        text = t("admin:specialists:item", lang) % name
-        buttons.append([
+    item_tpl = t("admin:specialists:item", lang)
+    buttons = [
+        [
             InlineKeyboardButton(
-                text=text,
-                callback_data=f"spec:view:{spec['id']}"
+                text=item_tpl % _specialist_list_name(spec, users_map),
+                callback_data="spec:view:" + str(spec["id"])
             )
-        ])
+        ]
+        for spec in page_items
+    ]
     
     # Пагинация
     nav = build_nav_row(page, total_pages, "spec:page:{p}", "spec:noop", lang)
@@ -339,23 +354,57 @@ def specialist_delete_confirm_inline(spec_id: int, lang: str) -> InlineKeyboardM
 # Helpers
 # ==============================================================
 
-def _get_user_full_name(user: dict) -> str:
-    """Получить полное имя пользователя."""
-    first = user.get("first_name") or ""
-    last = user.get("last_name") or ""
-    return f"{first} {last}".strip() or "?"
+def _user_sort_key(user: dict) -> str:
+    if USER_SORT_BY == "phone":
+        return user.get("phone") or ""
+    return user_full_name(user)
+
+
+def specialist_user_ids(specialists: list[dict]) -> set[int]:
+    """user_id всех специалистов."""
+    return set(map(_GET_USER_ID, specialists))
+
+
+def sort_available_users(users: list[dict], existing_specialist_user_ids: set[int]) -> list[dict]:
+    """
+    Пользователи, которые ещё не специалисты, в порядке USER_SORT_BY.
+    Считается один раз при входе в выбор; пагинация берёт порядок из FSM.
+    """
+    return sorted(
+        (u for u in users if u["id"] not in existing_specialist_user_ids),
+        key=_user_sort_key,
+    )
+
+
+# Поля пользователя, нужные для кнопок выбора и сортировки
+_USER_ROW_FIELDS = ("id", "first_name", "last_name", "phone")
+
+
+def compact_user_rows(users: list[dict]) -> list[dict]:
+    """Урезанные копии пользователей для хранения в FSM."""
+    return [{k: u.get(k) for k in _USER_ROW_FIELDS} for u in users]
+
+
+async def load_available_users(state: FSMContext) -> list[dict]:
+    """
+    Доступные пользователи в сохранённом порядке (available_users в FSM).
+    Пагинация не ходит в API: список снят один раз в start_create,
+    а выбор пользователя всё равно перепроверяется в create_user_selected.
+    """
+    data = await state.get_data()
+    return data.get("available_users", [])
+
+
+def toggle_id(ids: list[int], item_id: int) -> set[int]:
+    """Множество ids с переключённым item_id (в FSM хранится отсортированным списком)."""
+    selected = set(ids)
+    selected ^= {item_id}
+    return selected
 
 
 def _specialist_default_schedule() -> dict:
-    """Дефолтный график специалиста: Пн-Пт 10:00-19:00."""
-    from bot.app.utils.schedule_helper import DAYS
-    schedule = {}
-    for day in DAYS:
-        if day in ("sat", "sun"):
-            schedule[day] = None
-        else:
-            schedule[day] = {"start": "10:00", "end": "19:00"}
-    return schedule
+    """Изменяемая копия дефолтного графика для FSM."""
+    return {day: (dict(v) if v else None) for day, v in _DEFAULT_WORK_SCHEDULE.items()}
 
 
 def build_progress_text(data: dict, lang: str, prompt_key: str) -> str:
@@ -378,15 +427,32 @@ def build_progress_text(data: dict, lang: str, prompt_key: str) -> str:
     return "\n".join(lines)
 
 
+async def build_specialists_list_view(lang: str, page: int = 0) -> tuple[str, InlineKeyboardMarkup]:
+    """Текст и клавиатура списка специалистов (единственное место загрузки списка)."""
+    specialists, users_map = await asyncio.gather(api.get_specialists(), api.get_users_map())
+    
+    total = len(specialists)
+    if total == 0:
+        text = f"👤 {t('admin:specialists:empty', lang)}"
+    else:
+        text = t("admin:specialists:list_title", lang) % total
+    
+    return text, specialists_list_inline(specialists, users_map, page, lang)
+
+
 async def build_specialist_view_text(spec: dict, lang: str) -> str:
     """Текст карточки специалиста."""
-    # Получаем user
-    user = await api.get_user(spec["user_id"])
+    # user, услуги специалиста и справочник услуг — независимые запросы
+    user, spec_services, services_map = await asyncio.gather(
+        api.get_user(spec["user_id"]),
+        api.get_specialist_services(spec["id"]),
+        api.get_services_map(),
+    )
     
     # Имя
     name = spec.get("display_name")
     if not name and user:
-        name = _get_user_full_name(user)
+        name = user_full_name(user)
     name = name or "?"
     
     lines = [t("admin:specialist:view_title", lang) % name, ""]
@@ -404,7 +470,7 @@ async def build_specialist_view_text(spec: dict, lang: str) -> str:
     # График
     if spec.get("work_schedule"):
         try:
-            schedule = json.loads(spec["work_schedule"]) if isinstance(spec["work_schedule"], str) else spec["work_schedule"]
+            schedule = parse_schedule(spec["work_schedule"])
             if schedule:
                 schedule_str = format_schedule_compact(schedule, lang)
                 lines.append(f"📅 {schedule_str}")
@@ -412,16 +478,14 @@ async def build_specialist_view_text(spec: dict, lang: str) -> str:
             pass
     
     # Услуги
-    spec_services = await api.get_specialist_services(spec["id"])
     active_services = [ss for ss in spec_services if ss.get("is_active", True)]
     
     lines.append("")
     if active_services:
         lines.append(t("admin:specialist:services_count", lang) % len(active_services))
-        services = await api.get_services()
-        services_map = {s["id"]: s["name"] for s in services}
         for ss in active_services:
-            svc_name = services_map.get(ss["service_id"], "?")
+            svc = services_map.get(ss["service_id"])
+            svc_name = svc["name"] if svc else "?"
             lines.append(f"  • {svc_name}")
     else:
         lines.append(t("admin:specialist:no_services", lang))
@@ -435,70 +499,42 @@ async def build_specialist_view_text(spec: dict, lang: str) -> str:
 
 def setup(mc, get_user_role):
     router = Router(name="specialists")
-    logger.info("=== specialists.setup() called ===")
+    # Язык апдейта → CURRENT_LANG (один GET, только для хэндлеров этого flow)
+    use_lang_middleware(router)
+    logger.debug("=== specialists.setup() called ===")
     
     # ==========================================================
     # LIST
     # ==========================================================
     
-    async def show_list(message: Message, page: int = 0):
-        tg_id = message.from_user.id
-        lang = user_lang.get(tg_id, DEFAULT_LANG)
-        
-        specialists = await api.get_specialists()
-        users = await api.get_users()
-        users_map = {u["id"]: u for u in users}
-        
-        total = len(specialists)
-        
-        if total == 0:
-            text = f"👤 {t('admin:specialists:empty', lang)}"
-        else:
-            text = t("admin:specialists:list_title", lang) % total
+    async def show_list(message: Message, lang: str, page: int = 0):
+        """Список (вход из reply-меню: lang передаёт admin_reply)."""
         
-        kb = specialists_list_inline(specialists, users_map, page, lang)
+        text, kb = await build_specialists_list_view(lang, page)
         await mc.show_inline_readonly(message, text, kb)
     
     router.show_list = show_list
     
-    @router.callback_query(F.data.startswith("spec:page:"))
-    async def list_page(callback: CallbackQuery):
-        page = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    @router.callback_query(CallbackAction("spec", "page"))
+    async def list_page(callback: CallbackQuery, cb: CallbackParts):
+        page = int(cb[2])
+        lang = CURRENT_LANG.get()
         
-        specialists = await api.get_specialists()
-        users = await api.get_users()
-        users_map = {u["id"]: u for u in users}
-        
-        total = len(specialists)
-        
-        if total == 0:
-            text = f"👤 {t('admin:specialists:empty', lang)}"
-        else:
-            text = t("admin:specialists:list_title", lang) % total
-        
-        kb = specialists_list_inline(specialists, users_map, page, lang)
-        await mc.edit_inline(callback.message, text, kb)
-        await callback.answer()
+        text, kb = await build_specialists_list_view(lang, page)
+        await asyncio.gather(
+            mc.edit_inline(callback.message, text, kb),
+            callback.answer(),
+        )
     
     @router.callback_query(F.data == "spec:list:0")
     async def list_first_page(callback: CallbackQuery):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
-        
-        specialists = await api.get_specialists()
-        users = await api.get_users()
-        users_map = {u["id"]: u for u in users}
-        
-        total = len(specialists)
-        
-        if total == 0:
-            text = f"👤 {t('admin:specialists:empty', lang)}"
-        else:
-            text = t("admin:specialists:list_title", lang) % total
+        lang = CURRENT_LANG.get()
         
-        kb = specialists_list_inline(specialists, users_map, 0, lang)
-        await mc.edit_inline(callback.message, text, kb)
-        await callback.answer()
+        text, kb = await build_specialists_list_view(lang, 0)
+        await asyncio.gather(
+            mc.edit_inline(callback.message, text, kb),
+            callback.answer(),
+        )
     
     @router.callback_query(F.data == "spec:noop")
     async def noop(callback: CallbackQuery):
@@ -506,7 +542,7 @@ def setup(mc, get_user_role):
     
     @router.callback_query(F.data == "spec:back")
     async def list_back(callback: CallbackQuery, state: FSMContext):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         await state.clear()
         await mc.back_to_reply(
             callback.message,
@@ -520,30 +556,30 @@ def setup(mc, get_user_role):
     # VIEW
     # ==========================================================
     
-    @router.callback_query(F.data.startswith("spec:view:"))
-    async def view_specialist(callback: CallbackQuery, state: FSMContext):
-        spec_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
-        
-        await state.clear()
+    @router.callback_query(CallbackAction("spec", "view"))
+    async def view_specialist(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        spec_id = int(cb[2])
+        lang = CURRENT_LANG.get()
         
-        spec = await api.get_specialist(spec_id)
+        _, spec = await asyncio.gather(state.clear(), api.get_specialist(spec_id))
         if not spec:
             await callback.answer(t("common:error", lang), show_alert=True)
             return
         
         text = await build_specialist_view_text(spec, lang)
         kb = specialist_view_inline(spec, lang)
-        await mc.edit_inline(callback.message, text, kb)
-        await callback.answer()
+        await asyncio.gather(
+            mc.edit_inline(callback.message, text, kb),
+            callback.answer(),
+        )
     
     # ==========================================================
     # EDIT (delegation only)
     # ==========================================================
     
-    @router.callback_query(F.data.startswith("spec:edit:"))
-    async def edit_specialist(callback: CallbackQuery, state: FSMContext):
-        spec_id = int(callback.data.split(":")[2])
+    @router.callback_query(CallbackAction("spec", "edit"))
+    async def edit_specialist(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        spec_id = int(cb[2])
         await start_specialist_edit(
             mc=mc,
             callback=callback,
@@ -555,10 +591,10 @@ def setup(mc, get_user_role):
     # DELETE
     # ==========================================================
     
-    @router.callback_query(F.data.startswith("spec:delete:"))
-    async def delete_confirm(callback: CallbackQuery):
-        spec_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    @router.callback_query(CallbackAction("spec", "delete"))
+    async def delete_confirm(callback: CallbackQuery, cb: CallbackParts):
+        spec_id = int(cb[2])
+        lang = CURRENT_LANG.get()
         
         spec = await api.get_specialist(spec_id)
         if not spec:
@@ -569,7 +605,7 @@ def setup(mc, get_user_role):
         name = spec.get("display_name")
         if not name:
             user = await api.get_user(spec["user_id"])
-            name = _get_user_full_name(user) if user else "?"
+            name = user_full_name(user) if user else "?"
         
         text = (
             t("admin:specialist:confirm_delete", lang) % name
@@ -580,12 +616,28 @@ def setup(mc, get_user_role):
         await mc.edit_inline(callback.message, text, kb)
         await callback.answer()
     
-    @router.callback_query(F.data.startswith("spec:delete_confirm:"))
-    async def delete_execute(callback: CallbackQuery):
-        spec_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    # spec_id -> до какого момента (monotonic) повторное удаление считается дублем
+    recently_deleted: dict[int, float] = {}
+
+    @router.callback_query(CallbackAction("spec", "delete_confirm"))
+    async def delete_execute(callback: CallbackQuery, cb: CallbackParts):
+        spec_id = int(cb[2])
+        lang = CURRENT_LANG.get()
+        
+        # Двойной тап: второй апдейт ждёт первый, видит отметку об удалении
+        # и только отвечает на callback — без второго DELETE и перерисовки
+        async with user_locks.get(callback.from_user.id):
+            now = time.monotonic()
+            if recently_deleted.get(spec_id, 0.0) > now:
+                await callback.answer()
+                return
+            
+            ok = await api.delete_specialist(spec_id)
+            if ok:
+                for key in [k for k, until in recently_deleted.items() if until <= now]:
+                    del recently_deleted[key]
+                recently_deleted[spec_id] = now + DELETE_DEDUP_TTL
         
-        ok = await api.delete_specialist(spec_id)
         if not ok:
             await callback.answer(t("common:error", lang), show_alert=True)
             return
@@ -593,26 +645,15 @@ def setup(mc, get_user_role):
         await callback.answer(t("admin:specialist:deleted", lang))
         
         # Вернуться к списку
-        specialists = await api.get_specialists()
-        users = await api.get_users()
-        users_map = {u["id"]: u for u in users}
-        
-        total = len(specialists)
-        
-        if total == 0:
-            text = f"👤 {t('admin:specialists:empty', lang)}"
-        else:
-            text = t("admin:specialists:list_title", lang) % total
-        
-        kb = specialists_list_inline(specialists, users_map, 0, lang)
+        text, kb = await build_specialists_list_view(lang, 0)
         await mc.edit_inline(callback.message, text, kb)
     
     # ==========================================================
     # CREATE
     # ==========================================================
     
-    async def start_create(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+    async def start_create(message: Message, state: FSMContext, lang: str):
+        """Старт создания (вход из reply-меню: lang передаёт admin_reply)."""
         
         # Проверяем наличие услуг
         services = await api.get_services()
@@ -622,12 +663,11 @@ def setup(mc, get_user_role):
             return
         
         # Получаем пользователей и специалистов
-        users = await api.get_users()
-        specialists = await api.get_specialists()
-        existing_user_ids = {s["user_id"] for s in specialists}
+        users, specialists = await asyncio.gather(api.get_users(), api.get_specialists())
+        existing_user_ids = specialist_user_ids(specialists)
         
         # Проверяем есть ли свободные пользователи
-        available = [u for u in users if u["id"] not in existing_user_ids]
+        available = sort_available_users(users, existing_user_ids)
         if not available:
             text = t("admin:specialist:error_no_users", lang)
             await mc.show_inline_readonly(message, text, specialist_cancel_inline(lang))
@@ -637,26 +677,23 @@ def setup(mc, get_user_role):
         await state.update_data(
             lang=lang,
             selected_services=[],
-            schedule=_specialist_default_schedule()
+            schedule=_specialist_default_schedule(),
+            available_users=compact_user_rows(available),
+            existing_user_ids=sorted(existing_user_ids),
         )
         
         text = f"{t('admin:specialist:create_title', lang)}\n\n{t('admin:specialist:select_user', lang)}"
-        kb = users_select_inline(users, existing_user_ids, lang)
+        kb = users_select_inline(available, lang)
         await mc.show_inline_input(message, text, kb)
     
     router.start_create = start_create
     
     # ---- Reply "Back" button во время FSM (escape hatch)
-    @router.message(F.text.in_(t_all("admin:specialists:back")), SpecialistCreate.user)
-    @router.message(F.text.in_(t_all("admin:specialists:back")), SpecialistCreate.search_phone)
-    @router.message(F.text.in_(t_all("admin:specialists:back")), SpecialistCreate.display_name)
-    @router.message(F.text.in_(t_all("admin:specialists:back")), SpecialistCreate.description)
-    @router.message(F.text.in_(t_all("admin:specialists:back")), SpecialistCreate.services)
-    @router.message(F.text.in_(t_all("admin:specialists:back")), SpecialistCreate.schedule)
-    @router.message(F.text.in_(t_all("admin:specialists:back")), SpecialistCreate.schedule_day)
+    # Любой шаг SpecialistCreate — одна регистрация вместо хэндлера на каждый state
+    @router.message(F.text.in_(t_all("admin:specialists:back")), StateFilter(SpecialistCreate))
     async def fsm_back_escape(message: Message, state: FSMContext):
         """Escape hatch: Reply Back во время FSM → отмена и возврат в меню."""
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         await state.clear()
         await mc.show(
             message,
@@ -666,32 +703,30 @@ def setup(mc, get_user_role):
         )
     
     async def send_step(message: Message, text: str, kb: InlineKeyboardMarkup):
-        try:
-            await message.delete()
-        except Exception:
-            pass
-        return await mc.send_inline_in_flow(message.bot, message.chat.id, text, kb)
+        # Ввод пользователя удаляется в фоне, prompt правится на месте (один вызов Bot API)
+        mc.delete_in_background(message)
+        await mc.edit_inline_in_flow(message.bot, message.chat.id, text, kb)
     
     # ---- user pagination
-    @router.callback_query(F.data.startswith("spec_create:user_page:"), SpecialistCreate.user)
-    async def create_user_page(callback: CallbackQuery, state: FSMContext):
-        page = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    @router.callback_query(CallbackAction("spec_create", "user_page"), SpecialistCreate.user)
+    async def create_user_page(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        page = int(cb[2])
+        lang = CURRENT_LANG.get()
         
-        users = await api.get_users()
-        specialists = await api.get_specialists()
-        existing_user_ids = {s["user_id"] for s in specialists}
+        available = await load_available_users(state)
         
         text = f"{t('admin:specialist:create_title', lang)}\n\n{t('admin:specialist:select_user', lang)}"
-        kb = users_select_inline(users, existing_user_ids, lang, page=page)
+        kb = users_select_inline(available, lang, page=page)
         
-        await mc.edit_inline(callback.message, text, kb)
-        await callback.answer()
+        await asyncio.gather(
+            mc.edit_inline(callback.message, text, kb),
+            callback.answer(),
+        )
     
     # ---- search phone button
     @router.callback_query(F.data == "spec_create:search", SpecialistCreate.user)
     async def create_search_start(callback: CallbackQuery, state: FSMContext):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         
         await state.set_state(SpecialistCreate.search_phone)
         
@@ -704,96 +739,87 @@ def setup(mc, get_user_role):
     # ---- search phone input
     @router.message(SpecialistCreate.search_phone)
     async def create_search_process(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         phone = message.text.strip()
         
-        # Ищем пользователя по телефону
-        users = await api.get_users(phone=phone)
-        specialists = await api.get_specialists()
-        existing_user_ids = {s["user_id"] for s in specialists}
+        # Поиск на стороне backend (телефон/имя, с лимитом) — без выгрузки всех пользователей
+        data, users = await asyncio.gather(state.get_data(), api.search_users(phone))
+        existing_user_ids = data.get("existing_user_ids")
+        if existing_user_ids is None:
+            existing_user_ids = specialist_user_ids(await api.get_specialists())
         
         # Фильтруем
-        available = [u for u in users if u["id"] not in existing_user_ids]
-        
-        try:
-            await message.delete()
-        except Exception:
-            pass
+        available = sort_available_users(users, set(existing_user_ids))
         
         if not available:
             text = t("admin:specialist:search_not_found", lang)
             kb = search_back_inline(lang)
-            await mc.send_inline_in_flow(message.bot, message.chat.id, text, kb)
+            await send_step(message, text, kb)
             return
         
         # Если найден один — сразу выбираем
         if len(available) == 1:
             user = available[0]
-            user_name = _get_user_full_name(user)
-            
-            await state.update_data(
-                user_id=user["id"],
-                user_name=user_name
+            data = {**data, "user_id": user["id"], "user_name": user_full_name(user)}
+            await asyncio.gather(
+                state.set_data(data),
+                state.set_state(SpecialistCreate.display_name),
             )
-            await state.set_state(SpecialistCreate.display_name)
             
-            data = await state.get_data()
             text = build_progress_text(data, lang, "admin:specialist:enter_display_name")
             kb = specialist_skip_inline(lang)
-            await mc.send_inline_in_flow(message.bot, message.chat.id, text, kb)
+            await send_step(message, text, kb)
             return
         
         # Если найдено несколько — показываем список
         await state.set_state(SpecialistCreate.user)
         text = f"{t('admin:specialist:create_title', lang)}\n\n{t('admin:specialist:select_user', lang)}"
-        kb = users_select_inline(available, set(), lang)
-        await mc.send_inline_in_flow(message.bot, message.chat.id, text, kb)
+        kb = users_select_inline(available, lang)
+        await send_step(message, text, kb)
     
     # ---- search back
     @router.callback_query(F.data == "spec_create:search_back")
     async def create_search_back(callback: CallbackQuery, state: FSMContext):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         
         await state.set_state(SpecialistCreate.user)
         
-        users = await api.get_users()
-        specialists = await api.get_specialists()
-        existing_user_ids = {s["user_id"] for s in specialists}
+        available = await load_available_users(state)
         
         text = f"{t('admin:specialist:create_title', lang)}\n\n{t('admin:specialist:select_user', lang)}"
-        kb = users_select_inline(users, existing_user_ids, lang)
+        kb = users_select_inline(available, lang)
         
         await mc.edit_inline(callback.message, text, kb)
         await callback.answer()
     
     # ---- user selected
-    @router.callback_query(F.data.startswith("spec_create:user:"), SpecialistCreate.user)
-    async def create_user_selected(callback: CallbackQuery, state: FSMContext):
-        user_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    @router.callback_query(CallbackAction("spec_create", "user"), SpecialistCreate.user)
+    async def create_user_selected(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        user_id = int(cb[2])
+        lang = CURRENT_LANG.get()
         
-        # Проверяем что пользователь ещё не специалист
-        specialists = await api.get_specialists()
-        existing_user_ids = {s["user_id"] for s in specialists}
+        data, user = await asyncio.gather(state.get_data(), api.get_user(user_id))
+        
+        # Проверяем что пользователь ещё не специалист: набор снят в start_create,
+        # в API идём только если его нет в FSM. Окончательно дубль отсекает backend (UNIQUE user_id).
+        existing_user_ids = data.get("existing_user_ids")
+        if existing_user_ids is None:
+            existing_user_ids = specialist_user_ids(await api.get_specialists())
         
         if user_id in existing_user_ids:
             await callback.answer(t("admin:specialist:error_user_is_specialist", lang), show_alert=True)
             return
         
-        user = await api.get_user(user_id)
         if not user:
             await callback.answer(t("common:error", lang), show_alert=True)
             return
         
-        user_name = _get_user_full_name(user)
-        
-        await state.update_data(
-            user_id=user_id,
-            user_name=user_name
+        data = {**data, "user_id": user_id, "user_name": user_full_name(user)}
+        await asyncio.gather(
+            state.set_data(data),
+            state.set_state(SpecialistCreate.display_name),
         )
-        await state.set_state(SpecialistCreate.display_name)
         
-        data = await state.get_data()
         text = build_progress_text(data, lang, "admin:specialist:enter_display_name")
         kb = specialist_skip_inline(lang)
         
@@ -803,7 +829,7 @@ def setup(mc, get_user_role):
     # ---- display_name skip
     @router.callback_query(F.data == "spec_create:skip", SpecialistCreate.display_name)
     async def skip_display_name(callback: CallbackQuery, state: FSMContext):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         
         # display_name = None, будем использовать user_name
         await state.update_data(display_name=None)
@@ -819,7 +845,7 @@ def setup(mc, get_user_role):
     # ---- display_name input
     @router.message(SpecialistCreate.display_name)
     async def create_display_name(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         display_name = message.text.strip() or None
         
         await state.update_data(display_name=display_name)
@@ -834,13 +860,14 @@ def setup(mc, get_user_role):
     # ---- description skip
     @router.callback_query(F.data == "spec_create:skip", SpecialistCreate.description)
     async def skip_description(callback: CallbackQuery, state: FSMContext):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
-        
-        await state.update_data(description=None)
-        await state.set_state(SpecialistCreate.services)
+        lang = CURRENT_LANG.get()
         
-        services = await api.get_services()
-        data = await state.get_data()
+        data = {**await state.get_data(), "description": None, "svc_page": 0}
+        services, *_ = await asyncio.gather(
+            api.get_services(),
+            state.set_data(data),
+            state.set_state(SpecialistCreate.services),
+        )
         selected = set(data.get("selected_services", []))
         
         text = build_progress_text(data, lang, "admin:specialist:select_services")
@@ -852,14 +879,15 @@ def setup(mc, get_user_role):
     # ---- description input
     @router.message(SpecialistCreate.description)
     async def create_description(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         description = message.text.strip() or None
         
-        await state.update_data(description=description)
-        await state.set_state(SpecialistCreate.services)
-        
-        services = await api.get_services()
-        data = await state.get_data()
+        data = {**await state.get_data(), "description": description, "svc_page": 0}
+        services, *_ = await asyncio.gather(
+            api.get_services(),
+            state.set_data(data),
+            state.set_state(SpecialistCreate.services),
+        )
         selected = set(data.get("selected_services", []))
         
         text = build_progress_text(data, lang, "admin:specialist:select_services")
@@ -868,43 +896,50 @@ def setup(mc, get_user_role):
         await send_step(message, text, kb)
     
     # ---- services toggle
-    @router.callback_query(F.data.startswith("spec_create:svc_toggle:"), SpecialistCreate.services)
-    async def create_toggle_service(callback: CallbackQuery, state: FSMContext):
-        svc_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    @router.callback_query(CallbackAction("spec_create", "svc_toggle"), SpecialistCreate.services)
+    async def create_toggle_service(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        svc_id = int(cb[2])
+        lang = CURRENT_LANG.get()
         
         data = await state.get_data()
-        selected = set(data.get("selected_services", []))
-        
-        if svc_id in selected:
-            selected.discard(svc_id)
-        else:
-            selected.add(svc_id)
+        selected = toggle_id(data.get("selected_services", []), svc_id)
         
-        await state.update_data(selected_services=list(selected))
+        # data уже прочитан → set_data (update_data сделал бы ещё один GET); услуги — параллельно
+        data = {**data, "selected_services": sorted(selected)}
+        _, services = await asyncio.gather(state.set_data(data), api.get_services())
         
-        services = await api.get_services()
         text = build_progress_text(data, lang, "admin:specialist:select_services")
-        kb = services_multiselect_inline(services, selected, lang)
+        kb = services_multiselect_inline(services, selected, lang, page=data.get("svc_page", 0))
         
-        await mc.edit_inline(callback.message, text, kb)
-        await callback.answer()
+        await asyncio.gather(
+            mc.edit_inline(callback.message, text, kb),
+            callback.answer(),
+        )
     
     # ---- services page
-    @router.callback_query(F.data.startswith("spec_create:svc_page:"), SpecialistCreate.services)
-    async def create_services_page(callback: CallbackQuery, state: FSMContext):
-        page = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    @router.callback_query(CallbackAction("spec_create", "svc_page"), SpecialistCreate.services)
+    async def create_services_page(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        page = int(cb[2])
+        lang = CURRENT_LANG.get()
         
         data = await state.get_data()
+        
+        # Повторный клик по той же странице (двойной тап) — без API и edit
+        if data.get("svc_page", 0) == page:
+            await callback.answer()
+            return
+        
         selected = set(data.get("selected_services", []))
+        data = {**data, "svc_page": page}
+        _, services = await asyncio.gather(state.set_data(data), api.get_services())
         
-        services = await api.get_services()
         text = build_progress_text(data, lang, "admin:specialist:select_services")
         kb = services_multiselect_inline(services, selected, lang, page=page)
         
-        await mc.edit_inline(callback.message, text, kb)
-        await callback.answer()
+        await asyncio.gather(
+            mc.edit_inline(callback.message, text, kb),
+            callback.answer(),
+        )
     
     @router.callback_query(F.data == "spec_create:noop")
     async def create_noop(callback: CallbackQuery):
@@ -913,7 +948,7 @@ def setup(mc, get_user_role):
     # ---- services done → schedule
     @router.callback_query(F.data == "spec_create:svc_done", SpecialistCreate.services)
     async def create_services_done(callback: CallbackQuery, state: FSMContext):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         data = await state.get_data()
         
         selected = set(data.get("selected_services", []))
@@ -921,24 +956,25 @@ def setup(mc, get_user_role):
             await callback.answer(t("admin:specialist:error_no_services_selected", lang), show_alert=True)
             return
         
-        await state.set_state(SpecialistCreate.schedule)
-        
-        schedule = data.get("schedule", _specialist_default_schedule())
+        schedule = data.get("schedule") or _DEFAULT_WORK_SCHEDULE
         
         text = t("schedule:title", lang)
         kb = schedule_days_inline(schedule, lang, prefix="spec_sched")
         
-        await mc.edit_inline(callback.message, text, kb)
-        await callback.answer()
+        await asyncio.gather(
+            state.set_state(SpecialistCreate.schedule),
+            mc.edit_inline(callback.message, text, kb),
+            callback.answer(),
+        )
     
     # ==========================================================
     # SCHEDULE (CREATE)
     # ==========================================================
     
-    @router.callback_query(F.data.startswith("spec_sched:day:"))
-    async def schedule_day_selected(callback: CallbackQuery, state: FSMContext):
-        day = callback.data.split(":")[2]
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    @router.callback_query(CallbackAction("spec_sched", "day"))
+    async def schedule_day_selected(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        day = cb[2]
+        lang = CURRENT_LANG.get()
         
         data = await state.get_data()
         schedule = data.get("schedule", {})
@@ -955,21 +991,20 @@ def setup(mc, get_user_role):
         )
         
         kb = schedule_day_edit_inline(day, schedule, lang, prefix="spec_sched")
-        await mc.edit_inline(callback.message, text, kb)
-        await callback.answer()
+        await asyncio.gather(
+            mc.edit_inline(callback.message, text, kb),
+            callback.answer(),
+        )
     
     @router.message(SpecialistCreate.schedule_day)
     async def process_schedule_time(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         text_input = message.text.strip()
         
         result = parse_time_input(text_input)
         
         if result == "error":
-            try:
-                await message.delete()
-            except Exception:
-                pass
+            mc.delete_in_background(message)
             err_msg = await message.answer(t("schedule:invalid", lang))
             await mc._add_inline_id(message.chat.id, err_msg.message_id)
             return
@@ -986,10 +1021,10 @@ def setup(mc, get_user_role):
         kb = schedule_days_inline(schedule, lang, prefix="spec_sched")
         await send_step(message, text, kb)
     
-    @router.callback_query(F.data.startswith("spec_sched:dayoff:"))
-    async def schedule_day_off(callback: CallbackQuery, state: FSMContext):
-        day = callback.data.split(":")[2]
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    @router.callback_query(CallbackAction("spec_sched", "dayoff"))
+    async def schedule_day_off(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        day = cb[2]
+        lang = CURRENT_LANG.get()
         
         data = await state.get_data()
         schedule = data.get("schedule", {})
@@ -1001,12 +1036,14 @@ def setup(mc, get_user_role):
         text = t("schedule:title", lang)
         kb = schedule_days_inline(schedule, lang, prefix="spec_sched")
         
-        await mc.edit_inline(callback.message, text, kb)
-        await callback.answer()
+        await asyncio.gather(
+            mc.edit_inline(callback.message, text, kb),
+            callback.answer(),
+        )
     
     @router.callback_query(F.data == "spec_sched:back")
     async def schedule_back(callback: CallbackQuery, state: FSMContext):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         
         await state.set_state(SpecialistCreate.schedule)
         
@@ -1016,36 +1053,44 @@ def setup(mc, get_user_role):
         text = t("schedule:title", lang)
         kb = schedule_days_inline(schedule, lang, prefix="spec_sched")
         
-        await mc.edit_inline(callback.message, text, kb)
-        await callback.answer()
+        await asyncio.gather(
+            mc.edit_inline(callback.message, text, kb),
+            callback.answer(),
+        )
     
     # ---- schedule save → CREATE SPECIALIST
     @router.callback_query(F.data == "spec_sched:save")
     async def schedule_save(callback: CallbackQuery, state: FSMContext):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
-        data = await state.get_data()
-        
-        # Создаём специалиста
-        specialist = await api.create_specialist(
-            user_id=data["user_id"],
-            display_name=data.get("display_name"),
-            description=data.get("description"),
-            work_schedule=json.dumps(data.get("schedule", {}))
-        )
-        
-        if not specialist:
-            await callback.answer(t("common:error", lang), show_alert=True)
-            return
+        lang = CURRENT_LANG.get()
         
-        # Создаём связи с услугами
-        selected = set(data.get("selected_services", []))
-        for svc_id in selected:
-            await api.add_specialist_service(specialist["id"], svc_id)
+        # Двойной тап по Save: второй апдейт ждёт первый и видит очищенный FSM
+        async with user_locks.get(callback.from_user.id):
+            data = await state.get_data()
+            if "user_id" not in data:
+                await callback.answer()
+                return
+            
+            # Создаём специалиста
+            specialist = await api.create_specialist(
+                user_id=data["user_id"],
+                display_name=data.get("display_name"),
+                description=data.get("description"),
+                work_schedule=dump_schedule(data.get("schedule", {}))
+            )
+            
+            if not specialist:
+                await callback.answer(t("common:error", lang), show_alert=True)
+                return
+            
+            # Создаём связи с услугами
+            selected = set(data.get("selected_services", []))
+            await asyncio.gather(*(api.add_specialist_service(specialist["id"], svc_id) for svc_id in selected))
+            
+            await state.clear()
         
         # Имя для сообщения
         name = data.get("display_name") or data.get("user_name", "?")
         
-        await state.clear()
         await callback.answer(t("admin:specialist:created", lang) % name)
         
         await mc.back_to_reply(
@@ -1057,7 +1102,7 @@ def setup(mc, get_user_role):
     
     @router.callback_query(F.data == "spec_sched:cancel")
     async def schedule_cancel(callback: CallbackQuery, state: FSMContext):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         await state.clear()
         await callback.answer()
         await mc.back_to_reply(
@@ -1070,7 +1115,7 @@ def setup(mc, get_user_role):
     # ---- cancel create
     @router.callback_query(F.data == "spec_create:cancel")
     async def cancel_create(callback: CallbackQuery, state: FSMContext):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         await state.clear()
         await callback.answer()
         await mc.back_to_reply(
@@ -1083,7 +1128,7 @@ def setup(mc, get_user_role):
     # подключаем EDIT router
     router.include_router(setup_edit(mc, get_user_role))
     
-    logger.info("=== specialists router configured ===")
+    logger.debug("=== specialists router configured ===")
     return router
 
 
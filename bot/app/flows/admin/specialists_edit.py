@@ -16,29 +16,32 @@ EDIT-FSM for Specialists (admin).
 - Фото — заглушка (v2)
 """
 
-import json
+import asyncio
 import logging
-import math
+from functools import lru_cache
 
 from aiogram import F, Router
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup, Message
 
-from bot.app.i18n.loader import DEFAULT_LANG, t, t_all
+from bot.app.i18n.loader import CURRENT_LANG, t, t_all
 from bot.app.keyboards.schedule import (
     schedule_day_edit_inline,
     schedule_days_inline,
 )
 from bot.app.utils.api import api
+from bot.app.utils.callback import CallbackAction, CallbackParts
+from bot.app.utils.formatters import user_full_name
 from bot.app.utils.pagination import build_nav_row
 from bot.app.utils.schedule_helper import (
     default_schedule,
+    dump_schedule,
     format_day_value,
     format_schedule_compact,
+    parse_schedule,
     parse_time_input,
 )
-from bot.app.utils.state import user_lang
 
 logger = logging.getLogger(__name__)
 PAGE_SIZE = 5
@@ -60,8 +63,14 @@ class SpecialistEdit(StatesGroup):
 
 # ==============================================================
 # Inline keyboards for EDIT
+# Статичные клавиатуры зависят только от (spec_id, lang) → кэшируются.
+# Возвращаемые объекты общие: не мутировать.
 # ==============================================================
 
+KB_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=KB_CACHE_SIZE)
 def specialist_edit_inline(spec_id: int, lang: str) -> InlineKeyboardMarkup:
     """Экран редактирования специалиста."""
     return InlineKeyboardMarkup(inline_keyboard=[
@@ -104,6 +113,7 @@ def specialist_edit_inline(spec_id: int, lang: str) -> InlineKeyboardMarkup:
     ])
 
 
+@lru_cache(maxsize=KB_CACHE_SIZE)
 def specialist_edit_cancel_inline(spec_id: int, lang: str) -> InlineKeyboardMarkup:
     """Кнопка отмены при редактировании поля."""
     return InlineKeyboardMarkup(inline_keyboard=[[
@@ -126,24 +136,23 @@ def services_edit_multiselect_inline(
     ✅ — активна, ⬜ — неактивна.
     """
     total = len(services)
-    total_pages = max(1, math.ceil(total / PAGE_SIZE))
+    total_pages = max(1, (total + PAGE_SIZE - 1) // PAGE_SIZE)
     page = max(0, min(page, total_pages - 1))
     
     start = page * PAGE_SIZE
     end = start + PAGE_SIZE
     page_items = services[start:end]
     
-    buttons = []
-    
-    for svc in page_items:
-        is_active = svc["id"] in active_service_ids
-        icon = "✅" if is_active else "⬜"
-        buttons.append([
+    toggle_cb = f"spec:svc_toggle:{spec_id}:"
+    buttons = [
+        [
             InlineKeyboardButton(
-                text=f"{icon} {svc['name']}",
-                callback_data=f"spec:svc_toggle:{spec_id}:{svc['id']}"
+                text=f"{'✅' if svc['id'] in active_service_ids else '⬜'} {svc['name']}",
+                callback_data=toggle_cb + str(svc["id"])
             )
-        ])
+        ]
+        for svc in page_items
+    ]
     
     # Пагинация
     nav = build_nav_row(page, total_pages, f"spec:svc_page:{spec_id}:{{p}}", "spec:noop", lang)
@@ -161,12 +170,8 @@ def services_edit_multiselect_inline(
         )
     ])
     
-    buttons.append([
-        InlineKeyboardButton(
-            text=t("common:cancel", lang),
-            callback_data=f"spec:edit:{spec_id}"
-        )
-    ])
+    # Ряд «Отмена» — общий с кэшированной specialist_edit_cancel_inline
+    buttons.append(specialist_edit_cancel_inline(spec_id, lang).inline_keyboard[0])
     
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
@@ -175,20 +180,18 @@ def services_edit_multiselect_inline(
 # Helpers: texts
 # ==============================================================
 
-def _get_user_full_name(user: dict) -> str:
-    """Получить полное имя пользователя."""
-    first = user.get("first_name") or ""
-    last = user.get("last_name") or ""
-    return f"{first} {last}".strip() or "?"
-
-
 async def build_specialist_view_text(spec: dict, lang: str) -> str:
     """Текст карточки специалиста."""
-    user = await api.get_user(spec["user_id"])
+    # user, услуги специалиста и справочник услуг — независимые запросы
+    user, spec_services, services_map = await asyncio.gather(
+        api.get_user(spec["user_id"]),
+        api.get_specialist_services(spec["id"]),
+        api.get_services_map(),
+    )
     
     name = spec.get("display_name")
     if not name and user:
-        name = _get_user_full_name(user)
+        name = user_full_name(user)
     name = name or "?"
     
     lines = [t("admin:specialist:view_title", lang) % name, ""]
@@ -203,23 +206,21 @@ async def build_specialist_view_text(spec: dict, lang: str) -> str:
     
     if spec.get("work_schedule"):
         try:
-            schedule = json.loads(spec["work_schedule"]) if isinstance(spec["work_schedule"], str) else spec["work_schedule"]
+            schedule = parse_schedule(spec["work_schedule"])
             if schedule:
                 schedule_str = format_schedule_compact(schedule, lang)
                 lines.append(f"📅 {schedule_str}")
         except Exception:
             pass
     
-    spec_services = await api.get_specialist_services(spec["id"])
     active_services = [ss for ss in spec_services if ss.get("is_active", True)]
     
     lines.append("")
     if active_services:
         lines.append(t("admin:specialist:services_count", lang) % len(active_services))
-        services = await api.get_services()
-        services_map = {s["id"]: s["name"] for s in services}
         for ss in active_services:
-            svc_name = services_map.get(ss["service_id"], "?")
+            svc = services_map.get(ss["service_id"])
+            svc_name = svc["name"] if svc else "?"
             lines.append(f"  • {svc_name}")
     else:
         lines.append(t("admin:specialist:no_services", lang))
@@ -240,9 +241,8 @@ def build_specialist_edit_text(spec: dict, changes: dict, lang: str) -> str:
         schedule = changes["work_schedule"]
     else:
         try:
-            ws = spec.get("work_schedule", "{}")
-            schedule = json.loads(ws) if isinstance(ws, str) else ws
-        except Exception:
+            schedule = parse_schedule(spec.get("work_schedule"))
+        except ValueError:
             schedule = {}
     
     lines = [t("admin:specialist:edit_title", lang), ""]
@@ -267,23 +267,27 @@ def build_specialist_edit_text(spec: dict, changes: dict, lang: str) -> str:
     return "\n".join(lines)
 
 
+# Поле → ключ перевода, в порядке вывода
+_FIELD_KEYS = (
+    ("display_name", "admin:specialist:edit_name"),
+    ("description", "admin:specialist:edit_description"),
+    ("work_schedule", "admin:specialist:edit_schedule"),
+)
+_FIELD_EMOJIS = ("✏️ ", "📝 ", "📅 ", "📷 ")
+
+
+@lru_cache(maxsize=64)
+def _clean_field_name(key: str, lang: str) -> str:
+    """Название поля без эмодзи-префикса (зависит только от key и lang)."""
+    name = t(key, lang)
+    for emoji in _FIELD_EMOJIS:
+        name = name.replace(emoji, "")
+    return name
+
+
 def _get_changed_field_names(changes: dict, lang: str) -> list[str]:
     """Возвращает читаемые имена изменённых полей."""
-    field_map = {
-        "display_name": "admin:specialist:edit_name",
-        "description": "admin:specialist:edit_description",
-        "work_schedule": "admin:specialist:edit_schedule",
-    }
-    
-    names = []
-    for field, key in field_map.items():
-        if field in changes:
-            name = t(key, lang)
-            for emoji in ["✏️ ", "📝 ", "📅 ", "📷 "]:
-                name = name.replace(emoji, "")
-            names.append(name)
-    
-    return names
+    return [_clean_field_name(key, lang) for field, key in _FIELD_KEYS if field in changes]
 
 
 # ==============================================================
@@ -300,7 +304,7 @@ async def start_specialist_edit(
     """
     Entry point редактирования специалиста.
     """
-    lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    lang = CURRENT_LANG.get()
     
     spec = await api.get_specialist(spec_id)
     if not spec:
@@ -335,9 +339,12 @@ def setup(mc, get_user_role):
     Setup router with dependencies.
     Возвращает Router с EDIT handlers.
     """
+    # setup() вызывается из specialists.setup() — модуль уже загружен,
+    # импорт здесь обходит циклическую зависимость один раз, а не на каждый save
+    from .specialists import specialist_view_inline
     
     router = Router(name="specialists_edit")
-    logger.info("=== specialists_edit.setup() called ===")
+    logger.debug("=== specialists_edit.setup() called ===")
     
     # Импортируем admin_specialists из keyboards
     from bot.app.keyboards.admin import admin_specialists
@@ -354,7 +361,7 @@ def setup(mc, get_user_role):
     @router.message(F.text.in_(t_all("admin:specialists:back")), SpecialistEdit.services)
     async def edit_fsm_back_escape(message: Message, state: FSMContext):
         """Escape hatch: Reply Back во время Edit FSM → отмена и возврат."""
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         await state.clear()
         await mc.show(
             message,
@@ -367,10 +374,9 @@ def setup(mc, get_user_role):
     # EDIT: display_name
     # ==========================================================
     
-    @router.callback_query(F.data.startswith("spec:edit_name:"))
-    async def edit_name_start(callback: CallbackQuery, state: FSMContext):
-        spec_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def edit_name_start(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        spec_id = int(cb[2])
+        lang = CURRENT_LANG.get()
         
         await state.set_state(SpecialistEdit.name)
         
@@ -382,7 +388,7 @@ def setup(mc, get_user_role):
     
     @router.message(SpecialistEdit.name)
     async def edit_name_process(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         name = message.text.strip() or None
         
         data = await state.get_data()
@@ -403,10 +409,9 @@ def setup(mc, get_user_role):
     # EDIT: description
     # ==========================================================
     
-    @router.callback_query(F.data.startswith("spec:edit_desc:"))
-    async def edit_desc_start(callback: CallbackQuery, state: FSMContext):
-        spec_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def edit_desc_start(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        spec_id = int(cb[2])
+        lang = CURRENT_LANG.get()
         
         await state.set_state(SpecialistEdit.description)
         
@@ -418,7 +423,7 @@ def setup(mc, get_user_role):
     
     @router.message(SpecialistEdit.description)
     async def edit_desc_process(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         description = message.text.strip() or None
         
         data = await state.get_data()
@@ -439,20 +444,17 @@ def setup(mc, get_user_role):
     # EDIT: photo (STUB)
     # ==========================================================
     
-    @router.callback_query(F.data.startswith("spec:edit_photo:"))
-    async def edit_photo_stub(callback: CallbackQuery, state: FSMContext):
+    async def edit_photo_stub(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
         """Заглушка для фото — функционал в v2."""
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         await callback.answer(t("admin:specialist:photo_stub", lang), show_alert=True)
     
     # ==========================================================
     # EDIT: schedule
     # ==========================================================
     
-    @router.callback_query(F.data.startswith("spec:edit_sched:"))
-    async def edit_sched_start(callback: CallbackQuery, state: FSMContext):
-        spec_id = int(callback.data.split(":")[2])  # noqa: F841
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def edit_sched_start(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        lang = CURRENT_LANG.get()
         
         data = await state.get_data()
         changes = data.get("changes", {})
@@ -462,10 +464,12 @@ def setup(mc, get_user_role):
         if "work_schedule" in changes:
             schedule = changes["work_schedule"]
         else:
+            # parse_schedule кэширует разбор — dict только для чтения,
+            # дальше он лишь сериализуется в FSM
+            ws = spec.get("work_schedule", "{}")
             try:
-                ws = spec.get("work_schedule", "{}")
-                schedule = json.loads(ws) if isinstance(ws, str) else ws
-            except Exception:
+                schedule = parse_schedule(ws) if ws else default_schedule()
+            except ValueError:
                 schedule = default_schedule()
         
         await state.set_state(SpecialistEdit.schedule)
@@ -477,17 +481,20 @@ def setup(mc, get_user_role):
         await mc.edit_inline(callback.message, text, kb)
         await callback.answer()
     
-    @router.callback_query(F.data.startswith("spec_edit_sched:day:"))
-    async def edit_sched_day_selected(callback: CallbackQuery, state: FSMContext):
-        day = callback.data.split(":")[2]
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    @router.callback_query(CallbackAction("spec_edit_sched", "day"))
+    async def edit_sched_day_selected(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        day = cb[2]
+        lang = CURRENT_LANG.get()
         
         data = await state.get_data()
         schedule = data.get("edit_schedule", {})
         current = format_day_value(schedule.get(day), lang)
         
-        await state.set_state(SpecialistEdit.schedule_day)
-        await state.update_data(editing_day=day)
+        # Повторный выбор того же дня — FSM-данные не меняются
+        writes = [state.set_state(SpecialistEdit.schedule_day)]
+        if data.get("editing_day") != day:
+            writes.append(state.set_data({**data, "editing_day": day}))
+        await asyncio.gather(*writes)
         
         day_name = t(f"day:{day}:full", lang)
         text = (
@@ -502,7 +509,7 @@ def setup(mc, get_user_role):
     
     @router.message(SpecialistEdit.schedule_day)
     async def edit_sched_time_process(message: Message, state: FSMContext):
-        lang = user_lang.get(message.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         text_input = message.text.strip()
         
         result = parse_time_input(text_input)
@@ -516,27 +523,32 @@ def setup(mc, get_user_role):
         data = await state.get_data()
         day = data.get("editing_day")
         schedule = data.get("edit_schedule", {})
-        schedule[day] = result
         
-        await state.update_data(edit_schedule=schedule)
-        await state.set_state(SpecialistEdit.schedule)
+        writes = [state.set_state(SpecialistEdit.schedule)]
+        if schedule.get(day, ...) != result:
+            schedule[day] = result
+            writes.append(state.set_data({**data, "edit_schedule": schedule}))
+        await asyncio.gather(*writes)
         
         text = t("schedule:title", lang)
         kb = schedule_days_inline(schedule, lang, prefix="spec_edit_sched")
 
         await mc.show_inline_readonly(message, text, kb)
     
-    @router.callback_query(F.data.startswith("spec_edit_sched:dayoff:"))
-    async def edit_sched_day_off(callback: CallbackQuery, state: FSMContext):
-        day = callback.data.split(":")[2]
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    @router.callback_query(CallbackAction("spec_edit_sched", "dayoff"))
+    async def edit_sched_day_off(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        day = cb[2]
+        lang = CURRENT_LANG.get()
         
         data = await state.get_data()
         schedule = data.get("edit_schedule", {})
-        schedule[day] = None
         
-        await state.update_data(edit_schedule=schedule)
-        await state.set_state(SpecialistEdit.schedule)
+        # День уже выходной (повторный тап) — без записи в FSM
+        writes = [state.set_state(SpecialistEdit.schedule)]
+        if schedule.get(day, ...) is not None:
+            schedule[day] = None
+            writes.append(state.set_data({**data, "edit_schedule": schedule}))
+        await asyncio.gather(*writes)
         
         text = t("schedule:title", lang)
         kb = schedule_days_inline(schedule, lang, prefix="spec_edit_sched")
@@ -546,11 +558,9 @@ def setup(mc, get_user_role):
     
     @router.callback_query(F.data == "spec_edit_sched:back")
     async def edit_sched_back(callback: CallbackQuery, state: FSMContext):
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
-        
-        await state.set_state(SpecialistEdit.schedule)
+        lang = CURRENT_LANG.get()
         
-        data = await state.get_data()
+        _, data = await asyncio.gather(state.set_state(SpecialistEdit.schedule), state.get_data())
         schedule = data.get("edit_schedule", {})
         
         text = t("schedule:title", lang)
@@ -562,7 +572,7 @@ def setup(mc, get_user_role):
     @router.callback_query(F.data == "spec_edit_sched:save")
     async def edit_sched_save(callback: CallbackQuery, state: FSMContext):
         """Сохранить график в changes и вернуться на экран редактирования."""
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         
         data = await state.get_data()
         schedule = data.get("edit_schedule", {})
@@ -570,8 +580,10 @@ def setup(mc, get_user_role):
         changes = data.get("changes", {})
         
         changes["work_schedule"] = schedule
-        await state.update_data(changes=changes)
-        await state.set_state(None)
+        await asyncio.gather(
+            state.set_data({**data, "changes": changes}),
+            state.set_state(None),
+        )
         
         spec = data.get("original", {})
         text = build_specialist_edit_text(spec, changes, lang)
@@ -583,7 +595,7 @@ def setup(mc, get_user_role):
     @router.callback_query(F.data == "spec_edit_sched:cancel")
     async def edit_sched_cancel(callback: CallbackQuery, state: FSMContext):
         """Отменить редактирование графика."""
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+        lang = CURRENT_LANG.get()
         
         data = await state.get_data()
         spec_id = data.get("edit_spec_id")
@@ -602,71 +614,77 @@ def setup(mc, get_user_role):
     # EDIT: services (multi-select)
     # ==========================================================
     
-    @router.callback_query(F.data.startswith("spec:edit_services:"))
-    async def edit_services_start(callback: CallbackQuery, state: FSMContext):
-        spec_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def edit_services_start(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        spec_id = int(cb[2])
+        lang = CURRENT_LANG.get()
         
         await state.set_state(SpecialistEdit.services)
         
-        # Получаем текущие активные услуги специалиста
-        spec_services = await api.get_specialist_services(spec_id)
+        # Текущие активные услуги специалиста + справочник услуг (кэш ApiClient)
+        spec_services, services = await asyncio.gather(
+            api.get_specialist_services(spec_id),
+            api.get_services(),
+        )
         active_ids = {ss["service_id"] for ss in spec_services if ss.get("is_active", True)}
         
-        await state.update_data(edit_services=list(active_ids))
+        await state.update_data(edit_services=sorted(active_ids), svc_page=0)
         
-        services = await api.get_services()
         text = t("admin:specialist:services_title", lang)
         kb = services_edit_multiselect_inline(services, active_ids, spec_id, lang)
         
         await mc.edit_inline(callback.message, text, kb)
         await callback.answer()
     
-    @router.callback_query(F.data.startswith("spec:svc_toggle:"), SpecialistEdit.services)
-    async def edit_services_toggle(callback: CallbackQuery, state: FSMContext):
-        parts = callback.data.split(":")
-        spec_id = int(parts[2])
-        svc_id = int(parts[3])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    @router.callback_query(CallbackAction("spec", "svc_toggle"), SpecialistEdit.services)
+    async def edit_services_toggle(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        spec_id = int(cb[2])
+        svc_id = int(cb[3])
+        lang = CURRENT_LANG.get()
         
-        data = await state.get_data()
+        # Список услуг берётся из in-process кэша ApiClient (не из FSM/Redis)
+        data, services = await asyncio.gather(state.get_data(), api.get_services())
+        # В FSM — отсортированный список, множество только для рендера
         active_ids = set(data.get("edit_services", []))
+        active_ids ^= {svc_id}
         
-        if svc_id in active_ids:
-            active_ids.discard(svc_id)
-        else:
-            active_ids.add(svc_id)
-        
-        await state.update_data(edit_services=list(active_ids))
+        await state.set_data({**data, "edit_services": sorted(active_ids)})
         
-        services = await api.get_services()
+        # Перерисовываем ту страницу, на которой был клик
         text = t("admin:specialist:services_title", lang)
-        kb = services_edit_multiselect_inline(services, active_ids, spec_id, lang)
+        kb = services_edit_multiselect_inline(services, active_ids, spec_id, lang, page=data.get("svc_page", 0))
         
         await mc.edit_inline(callback.message, text, kb)
         await callback.answer()
     
-    @router.callback_query(F.data.startswith("spec:svc_page:"), SpecialistEdit.services)
-    async def edit_services_page(callback: CallbackQuery, state: FSMContext):
-        parts = callback.data.split(":")
-        spec_id = int(parts[2])
-        page = int(parts[3])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    @router.callback_query(CallbackAction("spec", "svc_page"), SpecialistEdit.services)
+    async def edit_services_page(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        spec_id = int(cb[2])
+        page = int(cb[3])
+        lang = CURRENT_LANG.get()
         
         data = await state.get_data()
+        
+        # Повторный клик по той же странице (двойной тап) — без перерисовки
+        if data.get("svc_page", 0) == page:
+            await callback.answer()
+            return
+        
         active_ids = set(data.get("edit_services", []))
+        _, services = await asyncio.gather(
+            state.set_data({**data, "svc_page": page}),
+            api.get_services(),
+        )
         
-        services = await api.get_services()
         text = t("admin:specialist:services_title", lang)
         kb = services_edit_multiselect_inline(services, active_ids, spec_id, lang, page=page)
         
         await mc.edit_inline(callback.message, text, kb)
         await callback.answer()
     
-    @router.callback_query(F.data.startswith("spec:svc_save:"), SpecialistEdit.services)
-    async def edit_services_save(callback: CallbackQuery, state: FSMContext):
-        spec_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    @router.callback_query(CallbackAction("spec", "svc_save"), SpecialistEdit.services)
+    async def edit_services_save(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        spec_id = int(cb[2])
+        lang = CURRENT_LANG.get()
         
         data = await state.get_data()
         new_active_ids = set(data.get("edit_services", []))
@@ -678,28 +696,27 @@ def setup(mc, get_user_role):
             )
             return
         
-        # Получаем текущие specialist_services
-        spec_services = await api.get_specialist_services(spec_id)
-        existing_map = {ss["service_id"]: ss for ss in spec_services}
-        
-        all_services = await api.get_services()
+        # Текущие specialist_services + справочник услуг (кэш ApiClient)
+        spec_services, all_services = await asyncio.gather(
+            api.get_specialist_services(spec_id),
+            api.get_services(),
+        )
         all_svc_ids = {s["id"] for s in all_services}
-        
-        # Синхронизируем:
-        for svc_id in all_svc_ids:
-            ss = existing_map.get(svc_id)
-            
-            if svc_id in new_active_ids:
-                if ss is None:
-                    # Создаём новую связь
-                    await api.add_specialist_service(spec_id, svc_id)
-                elif not ss.get("is_active", True):
-                    # Активируем существующую
-                    await api.update_specialist_service(spec_id, svc_id, is_active=True)
-            else:
-                if ss is not None and ss.get("is_active", True):
-                    # Деактивируем
-                    await api.update_specialist_service(spec_id, svc_id, is_active=False)
+        # Синхронизируем только услуги из справочника
+        existing_map = {
+            ss["service_id"]: ss for ss in spec_services if ss["service_id"] in all_svc_ids
+        }
+        wanted = new_active_ids & all_svc_ids
+        
+        # Создаём новые связи, активируем/деактивируем существующие
+        ops = [api.add_specialist_service(spec_id, svc_id) for svc_id in wanted - existing_map.keys()]
+        for svc_id, ss in existing_map.items():
+            is_active = ss.get("is_active", True)
+            if (svc_id in wanted) != is_active:
+                ops.append(api.update_specialist_service(spec_id, svc_id, is_active=not is_active))
+        
+        if ops:
+            await asyncio.gather(*ops)
         
         await state.set_state(None)
         
@@ -716,10 +733,9 @@ def setup(mc, get_user_role):
     # SAVE: применить все изменения полей
     # ==========================================================
     
-    @router.callback_query(F.data.startswith("spec:save:"))
-    async def save_specialist(callback: CallbackQuery, state: FSMContext):
-        spec_id = int(callback.data.split(":")[2])
-        lang = user_lang.get(callback.from_user.id, DEFAULT_LANG)
+    async def save_specialist(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        spec_id = int(cb[2])
+        lang = CURRENT_LANG.get()
         
         data = await state.get_data()
         changes = data.get("changes", {})
@@ -736,7 +752,7 @@ def setup(mc, get_user_role):
         if "description" in changes:
             patch_data["description"] = changes["description"]
         if "work_schedule" in changes:
-            patch_data["work_schedule"] = json.dumps(changes["work_schedule"])
+            patch_data["work_schedule"] = dump_schedule(changes["work_schedule"])
         
         if patch_data:
             result = await api.update_specialist(spec_id, **patch_data)
@@ -750,11 +766,27 @@ def setup(mc, get_user_role):
         # Показать обновлённую карточку
         spec = await api.get_specialist(spec_id)
         if spec:
-            from .specialists import specialist_view_inline
             text = await build_specialist_view_text(spec, lang)
             kb = specialist_view_inline(spec, lang)
             await mc.edit_inline(callback.message, text, kb)
     
-    logger.info("=== specialists_edit router configured ===")
+    # ==========================================================
+    # DISPATCH: spec:<action>:<spec_id> → handler (один фильтр на все)
+    # ==========================================================
+
+    edit_routes = {
+        "edit_name": edit_name_start,
+        "edit_desc": edit_desc_start,
+        "edit_photo": edit_photo_stub,
+        "edit_sched": edit_sched_start,
+        "edit_services": edit_services_start,
+        "save": save_specialist,
+    }
+
+    @router.callback_query(CallbackAction("spec", *edit_routes))
+    async def edit_dispatch(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        await edit_routes[cb[1]](callback, state, cb)
+
+    logger.debug("=== specialists_edit router configured ===")
     return router
 
@@ -10,18 +10,23 @@ Flow:
 5. Подтверждение → POST /bookings
 """
 
+import asyncio
 import logging
-import math
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 
 from aiogram import F, Router
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery, ContentType, InlineKeyboardButton, InlineKeyboardMarkup, Message
 
-from bot.app.i18n.loader import DEFAULT_LANG, t
+from bot.app.i18n.loader import CURRENT_LANG, DEFAULT_LANG, t
+from bot.app.i18n.middleware import use_lang_middleware
+from bot.app.keyboards.client import client_main
 from bot.app.keyboards.common import request_phone_keyboard
 from bot.app.utils.api import api
+from bot.app.utils.callback import CallbackAction, CallbackParts
+from bot.app.utils.pagination import build_nav_row
 from bot.app.utils.phone_utils import (
     phone_required,
     save_user_phone,
@@ -33,6 +38,64 @@ logger = logging.getLogger(__name__)
 
 PAGE_SIZE = 5
 
+# Короткие названия дней недели для календаря (индекс = date.weekday())
+WEEKDAY_NAMES = ("Пн", "Вт", "Ср", "Чт", "Пт", "Сб", "Вс")
+
+
+# Поля, которые flow читает из FSM (остальное из ответов API в Redis не пишем)
+_PACKAGE_ROW_FIELDS = ("id", "name", "total_duration_min", "package_price")
+
+
+def format_price(price: float) -> str:
+    """Цена для текстов: целые рубли со знаком ₽."""
+    return f"{int(price)}₽" if price == int(price) else f"{price:.0f}₽"
+
+
+def package_label(pkg: dict) -> str:
+    """Текст кнопки пакета: «🛎 Название | 60 мин | 1500₽»."""
+    return f"🛎 {pkg['name']} | {pkg.get('total_duration_min') or 0} мин | {format_price(pkg.get('package_price') or 0)}"
+
+
+def compact_packages(packages: list[dict]) -> list[dict]:
+    """
+    Урезанные копии пакетов для хранения в FSM.
+    Текст кнопки (label) собирается один раз здесь, а не на каждой странице.
+    """
+    rows = []
+    for p in packages:
+        row = {k: p.get(k) for k in _PACKAGE_ROW_FIELDS}
+        row["label"] = package_label(row)
+        rows.append(row)
+    return rows
+
+
+def compact_calendar_days(days: list[dict]) -> list[dict]:
+    """Только дни со слотами (календарь показывает только их) и только дата."""
+    return [{"date": d["date"]} for d in days if d.get("has_slots")]
+
+
+@lru_cache(maxsize=512)
+def _day_label(date_str: str) -> str:
+    """YYYY-MM-DD → «Пн 24.11» для кнопки календаря."""
+    d = date.fromisoformat(date_str)
+    return f"{WEEKDAY_NAMES[d.weekday()]} {d:%d.%m}"
+
+
+def time_cb(time_str: str) -> str:
+    """HH:MM → HHMM для callback_data (без ":" — поле не дробится при разборе cb)."""
+    return time_str.replace(":", "")
+
+
+def time_from_cb(value: str) -> str:
+    """HHMM из callback_data → HH:MM."""
+    return f"{value[:2]}:{value[2:]}"
+
+
+@lru_cache(maxsize=512)
+def _date_display(date_str: str) -> str:
+    """YYYY-MM-DD → DD.MM.YYYY для текстов (набор дат в календаре ограничен)."""
+    return f"{date.fromisoformat(date_str):%d.%m.%Y}"
+
 
 # ==============================================================
 # FSM States
@@ -50,160 +113,152 @@ class ClientBooking(StatesGroup):
 
 # ==============================================================
 # Inline Keyboards
+# Страница клавиатуры зависит только от (элементы страницы, page, total_pages, lang):
+# сборка кэшируется по этому ключу, список в FSM пересоздаётся при новом входе
+# во flow → новый ключ. Возвращаемые объекты общие: не мутировать.
 # ==============================================================
 
+KB_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=64)
+def _text_btn(text_key: str, callback_data: str, lang: str) -> InlineKeyboardButton:
+    """Статичная кнопка (отмена/назад/заглушка): одна на (ключ, callback, lang)."""
+    return InlineKeyboardButton(text=t(text_key, lang), callback_data=callback_data)
+
+
+@lru_cache(maxsize=KB_CACHE_SIZE)
+def _packages_page_kb(
+    items: tuple[tuple[int, str], ...],
+    page: int,
+    total_pages: int,
+    lang: str
+) -> InlineKeyboardMarkup:
+    """Страница списка пакетов: items = ((id, label), ...)."""
+    buttons = [
+        [InlineKeyboardButton(text=label, callback_data=f"book:pkg:{pkg_id}")]
+        for pkg_id, label in items
+    ]
+
+    nav = build_nav_row(page, total_pages, "book:pkg_page:{p}", "book:noop", lang)
+    if nav:
+        buttons.append(nav)
+
+    buttons.append([_text_btn("common:cancel", "book:cancel", lang)])
+    return InlineKeyboardMarkup(inline_keyboard=buttons)
+
+
 def packages_list_inline(
     packages: list[dict],
     page: int,
     lang: str
 ) -> InlineKeyboardMarkup:
     """Список пакетов для выбора (клиент)."""
-    total = len(packages)
-    total_pages = max(1, math.ceil(total / PAGE_SIZE))
+    total_pages = max(1, (len(packages) + PAGE_SIZE - 1) // PAGE_SIZE)
     page = max(0, min(page, total_pages - 1))
 
     start = page * PAGE_SIZE
-    end = start + PAGE_SIZE
-    page_items = packages[start:end]
+    items = tuple(
+        (pkg["id"], pkg.get("label") or package_label(pkg))
+        for pkg in packages[start:start + PAGE_SIZE]
+    )
+    return _packages_page_kb(items, page, total_pages, lang)
 
-    buttons = []
 
-    for pkg in page_items:
-        duration = pkg.get("total_duration_min", 0)
-        price = pkg.get("package_price", 0) or 0
-        price_str = f"{int(price)}₽" if price == int(price) else f"{price:.0f}₽"
-
-        buttons.append([
-            InlineKeyboardButton(
-                text=f"🛎 {pkg['name']} | {duration} мин | {price_str}",
-                callback_data=f"book:pkg:{pkg['id']}"
-            )
+@lru_cache(maxsize=KB_CACHE_SIZE)
+def _days_page_kb(dates: tuple[str, ...], page: int, total_pages: int, lang: str) -> InlineKeyboardMarkup:
+    """Страница календаря: dates = ("YYYY-MM-DD", ...)."""
+    if not dates:
+        return InlineKeyboardMarkup(inline_keyboard=[
+            [_text_btn("client:booking:no_days", "book:noop", lang)],
+            [_text_btn("common:back", "book:back_service", lang)]
         ])
 
-    if total_pages > 1:
-        nav_row = []
-        if page > 0:
-            nav_row.append(InlineKeyboardButton(text=t("common:prev", lang), callback_data=f"book:pkg_page:{page - 1}"))
-        else:
-            nav_row.append(InlineKeyboardButton(text=" ", callback_data="book:noop"))
-        nav_row.append(InlineKeyboardButton(text=f"{page + 1}/{total_pages}", callback_data="book:noop"))
-        if page < total_pages - 1:
-            nav_row.append(InlineKeyboardButton(text=t("common:next", lang), callback_data=f"book:pkg_page:{page + 1}"))
-        else:
-            nav_row.append(InlineKeyboardButton(text=" ", callback_data="book:noop"))
-        buttons.append(nav_row)
+    # По 2 дня в ряд
+    day_buttons = [
+        InlineKeyboardButton(text=_day_label(d), callback_data=f"book:day:{d}")
+        for d in dates
+    ]
+    buttons = [day_buttons[i:i + 2] for i in range(0, len(day_buttons), 2)]
 
-    buttons.append([InlineKeyboardButton(text=t("common:cancel", lang), callback_data="book:cancel")])
+    nav = build_nav_row(page, total_pages, "book:day_page:{p}", "book:noop", lang)
+    if nav:
+        buttons.append(nav)
+
+    buttons.append([_text_btn("common:back", "book:back_service", lang)])
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
 def days_calendar_inline(days: list[dict], page: int, lang: str, days_per_page: int = 7) -> InlineKeyboardMarkup:
-    """Календарь доступных дней."""
-    available_days = [d for d in days if d.get("has_slots")]
-    
-    if not available_days:
+    """Календарь доступных дней (days уже отфильтрованы compact_calendar_days)."""
+    # Сессии, начатые до compact_calendar_days, хранят полный календарь с has_slots
+    days = [d for d in days if d.get("has_slots", True)]
+    total_pages = max(1, (len(days) + days_per_page - 1) // days_per_page)
+    page = max(0, min(page, total_pages - 1))
+
+    start = page * days_per_page
+    dates = tuple(d["date"] for d in days[start:start + days_per_page])
+    return _days_page_kb(dates, page, total_pages, lang)
+
+
+@lru_cache(maxsize=KB_CACHE_SIZE)
+def _time_page_kb(times: tuple[str, ...], page: int, total_pages: int, lang: str) -> InlineKeyboardMarkup:
+    """Страница времён: times = ("HH:MM", ...)."""
+    if not times:
         return InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text=t("client:booking:no_days", lang), callback_data="book:noop")],
-            [InlineKeyboardButton(text=t("common:back", lang), callback_data="book:back_service")]
+            [_text_btn("client:booking:no_slots", "book:noop", lang)],
+            [_text_btn("common:back", "book:back_day", lang)]
         ])
 
-    total = len(available_days)
-    total_pages = max(1, math.ceil(total / days_per_page))
-    page = max(0, min(page, total_pages - 1))
+    # Только время — без специалиста, по 2 в ряд
+    time_buttons = [
+        InlineKeyboardButton(text=time_str, callback_data=f"book:time:{time_cb(time_str)}")
+        for time_str in times
+    ]
+    buttons = [time_buttons[i:i + 2] for i in range(0, len(time_buttons), 2)]
 
-    start = page * days_per_page
-    end = start + days_per_page
-    page_items = available_days[start:end]
-
-    buttons = []
-    weekday_names = {0: "Пн", 1: "Вт", 2: "Ср", 3: "Чт", 4: "Пт", 5: "Сб", 6: "Вс"}
-
-    row = []
-    for day_info in page_items:
-        date_str = day_info["date"]
-        dt = datetime.strptime(date_str, "%Y-%m-%d")
-        display = f"{weekday_names[dt.weekday()]} {dt.strftime('%d.%m')}"
-        row.append(InlineKeyboardButton(text=display, callback_data=f"book:day:{date_str}"))
-        if len(row) == 2:
-            buttons.append(row)
-            row = []
-    if row:
-        buttons.append(row)
-
-    if total_pages > 1:
-        nav_row = []
-        if page > 0:
-            nav_row.append(InlineKeyboardButton(text=t("common:prev", lang), callback_data=f"book:day_page:{page - 1}"))
-        else:
-            nav_row.append(InlineKeyboardButton(text=" ", callback_data="book:noop"))
-        nav_row.append(InlineKeyboardButton(text=f"{page + 1}/{total_pages}", callback_data="book:noop"))
-        if page < total_pages - 1:
-            nav_row.append(InlineKeyboardButton(text=t("common:next", lang), callback_data=f"book:day_page:{page + 1}"))
-        else:
-            nav_row.append(InlineKeyboardButton(text=" ", callback_data="book:noop"))
-        buttons.append(nav_row)
+    nav = build_nav_row(page, total_pages, "book:time_page:{p}", "book:noop", lang)
+    if nav:
+        buttons.append(nav)
 
-    buttons.append([InlineKeyboardButton(text=t("common:back", lang), callback_data="book:back_service")])
+    buttons.append([_text_btn("common:back", "book:back_day", lang)])
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
 def time_slots_inline(slots: list[dict], page: int, lang: str, slots_per_page: int = 8) -> InlineKeyboardMarkup:
     """Список доступных времён."""
-    if not slots:
-        return InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text=t("client:booking:no_slots", lang), callback_data="book:noop")],
-            [InlineKeyboardButton(text=t("common:back", lang), callback_data="book:back_day")]
-        ])
-
-    total = len(slots)
-    total_pages = max(1, math.ceil(total / slots_per_page))
+    total_pages = max(1, (len(slots) + slots_per_page - 1) // slots_per_page)
     page = max(0, min(page, total_pages - 1))
 
     start = page * slots_per_page
-    end = start + slots_per_page
-    page_items = slots[start:end]
-
-    buttons = []
-    row = []
-    for slot in page_items:
-        time_str = slot["time"]
-        # Только время — без специалиста
-        row.append(InlineKeyboardButton(text=time_str, callback_data=f"book:time:{time_str}"))
-        if len(row) == 2:
-            buttons.append(row)
-            row = []
-    if row:
-        buttons.append(row)
-
-    if total_pages > 1:
-        nav_row = []
-        if page > 0:
-            nav_row.append(InlineKeyboardButton(text=t("common:prev", lang), callback_data=f"book:time_page:{page - 1}"))
-        else:
-            nav_row.append(InlineKeyboardButton(text=" ", callback_data="book:noop"))
-        nav_row.append(InlineKeyboardButton(text=f"{page + 1}/{total_pages}", callback_data="book:noop"))
-        if page < total_pages - 1:
-            nav_row.append(InlineKeyboardButton(text=t("common:next", lang), callback_data=f"book:time_page:{page + 1}"))
-        else:
-            nav_row.append(InlineKeyboardButton(text=" ", callback_data="book:noop"))
-        buttons.append(nav_row)
-
-    buttons.append([InlineKeyboardButton(text=t("common:back", lang), callback_data="book:back_day")])
+    times = tuple(slot["time"] for slot in slots[start:start + slots_per_page])
+    return _time_page_kb(times, page, total_pages, lang)
+
+
+@lru_cache(maxsize=KB_CACHE_SIZE)
+def _specialists_kb(specs: tuple[tuple[int, str], ...], time_str: str, lang: str) -> InlineKeyboardMarkup:
+    """Выбор специалиста: specs = ((id, name), ...)."""
+    spec_cb = f"book:spec:{time_cb(time_str)}:"
+    buttons = [
+        [InlineKeyboardButton(text=f"👤 {name}", callback_data=f"{spec_cb}{spec_id}")]
+        for spec_id, name in specs
+    ]
+    buttons.append([_text_btn("common:back", "book:back_time", lang)])
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
 def specialists_select_inline(specialists: list[dict], time_str: str, lang: str) -> InlineKeyboardMarkup:
     """Выбор специалиста."""
-    buttons = [[InlineKeyboardButton(text=f"👤 {spec['name']}", callback_data=f"book:spec:{time_str}:{spec['id']}")] for spec in specialists]
-    buttons.append([InlineKeyboardButton(text=t("common:back", lang), callback_data="book:back_time")])
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+    specs = tuple((spec["id"], spec["name"]) for spec in specialists)
+    return _specialists_kb(specs, time_str, lang)
 
 
+@lru_cache(maxsize=8)
 def confirm_booking_inline(lang: str) -> InlineKeyboardMarkup:
     """Подтверждение бронирования."""
     return InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text=t("client:booking:confirm_yes", lang), callback_data="book:confirm_yes")],
-        [InlineKeyboardButton(text=t("common:cancel", lang), callback_data="book:cancel")]
+        [_text_btn("client:booking:confirm_yes", "book:confirm_yes", lang)],
+        [_text_btn("common:cancel", "book:cancel", lang)]
     ])
 
 
@@ -214,6 +269,8 @@ def confirm_booking_inline(lang: str) -> InlineKeyboardMarkup:
 def setup(menu_controller, get_user_context):
     """Настройка роутера бронирования."""
     router = Router(name="client_booking")
+    # Язык апдейта → CURRENT_LANG (один GET, только для хэндлеров этого flow)
+    use_lang_middleware(router)
     mc = menu_controller
 
     # ==========================================================
@@ -224,17 +281,29 @@ def setup(menu_controller, get_user_context):
         """Точка входа в booking flow."""
         logger.info(f"[BOOKING] Starting for user_id={user_id}")
 
-        await state.update_data(user_id=user_id, lang=lang)
-
-        all_packages = await api.get_packages()
-        packages = [p for p in all_packages if p.get("show_on_booking") and p.get("is_active")]
+        # Локация не зависит от выбора пакета — берём её сразу, параллельно со списком,
+        # чтобы выбор пакета ждал только календарь
+        all_packages, locations = await asyncio.gather(api.get_packages(), api.get_locations())
+        packages = compact_packages(
+            [p for p in all_packages if p.get("show_on_booking") and p.get("is_active")]
+        )
         if not packages:
             await message.answer(t("client:booking:no_services", lang))
             await state.clear()
             return
 
-        await state.update_data(packages=packages)
-        await state.set_state(ClientBooking.service)
+        # Одна запись FSM-данных вместо нескольких update_data (каждый = GET + SET)
+        await asyncio.gather(
+            state.update_data(
+                user_id=user_id,
+                lang=lang,
+                packages=packages,
+                pkg_page=0,
+                location_id=locations[0]["id"] if locations else None,
+                company_id=locations[0].get("company_id") if locations else None,
+            ),
+            state.set_state(ClientBooking.service),
+        )
 
         kb = packages_list_inline(packages, page=0, lang=lang)
         await mc.show_inline_readonly(message, t("client:booking:select_service", lang), kb)
@@ -243,18 +312,27 @@ def setup(menu_controller, get_user_context):
     # SERVICE
     # ==========================================================
 
-    @router.callback_query(ClientBooking.service, F.data.startswith("book:pkg_page:"))
-    async def handle_package_page(callback: CallbackQuery, state: FSMContext):
-        page = int(callback.data.split(":")[-1])
+    @router.callback_query(ClientBooking.service, CallbackAction("book", "pkg_page"))
+    async def handle_package_page(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        page = int(cb[2])
         data = await state.get_data()
+
+        # Повторный клик по уже показанной странице (двойной тап) — без edit
+        if data.get("pkg_page", 0) == page:
+            await callback.answer()
+            return
+
         lang = data.get("lang", DEFAULT_LANG)
         kb = packages_list_inline(data.get("packages", []), page, lang)
-        await mc.edit_inline(callback.message, t("client:booking:select_service", lang), kb)
-        await callback.answer()
+        await asyncio.gather(
+            state.set_data({**data, "pkg_page": page}),
+            mc.edit_inline(callback.message, t("client:booking:select_service", lang), kb),
+            callback.answer(),
+        )
 
-    @router.callback_query(ClientBooking.service, F.data.startswith("book:pkg:"))
-    async def handle_package_select(callback: CallbackQuery, state: FSMContext):
-        pkg_id = int(callback.data.split(":")[-1])
+    @router.callback_query(ClientBooking.service, CallbackAction("book", "pkg"))
+    async def handle_package_select(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        pkg_id = int(cb[2])
         data = await state.get_data()
         lang = data.get("lang", DEFAULT_LANG)
         packages = data.get("packages", [])
@@ -266,64 +344,84 @@ def setup(menu_controller, get_user_context):
 
         logger.info(f"[BOOKING] Package: {pkg['name']} (id={pkg_id})")
 
-        await state.update_data(
-            service_package_id=pkg_id,
-            service_name=pkg["name"],
-            service_duration=pkg.get("total_duration_min", 0),
-            service_price=pkg.get("package_price", 0) or 0,
-        )
-
-        locations = await api.get_locations()
-        if not locations:
-            await callback.answer(t("client:booking:no_locations", lang), show_alert=True)
-            return
-
-        location_id = locations[0]["id"]
-        company_id = locations[0].get("company_id")
-        await state.update_data(location_id=location_id, company_id=company_id)
+        location_id = data.get("location_id")
+        company_id = data.get("company_id")
+        if location_id is None:
+            # Локаций не было на старте flow — проверяем ещё раз
+            locations = await api.get_locations()
+            if not locations:
+                await callback.answer(t("client:booking:no_locations", lang), show_alert=True)
+                return
+            location_id = locations[0]["id"]
+            company_id = locations[0].get("company_id")
 
         calendar = await api.get_slots_calendar(location_id)
         if not calendar or not calendar.get("days"):
             await callback.answer(t("client:booking:no_calendar", lang), show_alert=True)
             return
 
-        days = calendar["days"]
-        await state.update_data(calendar_days=days)
-        await state.set_state(ClientBooking.day)
+        days = compact_calendar_days(calendar["days"])
+        await asyncio.gather(
+            state.set_data({
+                **data,
+                "service_package_id": pkg_id,
+                "service_name": pkg["name"],
+                "service_duration": pkg.get("total_duration_min") or 0,
+                "service_price": pkg.get("package_price") or 0,
+                "location_id": location_id,
+                "company_id": company_id,
+                "calendar_days": days,
+                "day_page": 0,
+            }),
+            state.set_state(ClientBooking.day),
+        )
 
         kb = days_calendar_inline(days, page=0, lang=lang)
-        await callback.message.edit_text(text=t("client:booking:select_day", lang), reply_markup=kb)
-        await callback.answer()
+        await asyncio.gather(
+            mc.edit_inline(callback.message, t("client:booking:select_day", lang), kb),
+            callback.answer(),
+        )
 
     # ==========================================================
     # DAY
     # ==========================================================
 
-    @router.callback_query(ClientBooking.day, F.data.startswith("book:day_page:"))
-    async def handle_day_page(callback: CallbackQuery, state: FSMContext):
-        page = int(callback.data.split(":")[-1])
+    @router.callback_query(ClientBooking.day, CallbackAction("book", "day_page"))
+    async def handle_day_page(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        page = int(cb[2])
         data = await state.get_data()
-        kb = days_calendar_inline(data.get("calendar_days", []), page, data.get("lang", DEFAULT_LANG))
-        await callback.message.edit_reply_markup(reply_markup=kb)
-        await callback.answer()
+
+        # Повторный клик по уже показанной странице (двойной тап) — без edit
+        if data.get("day_page", 0) == page:
+            await callback.answer()
+            return
+
+        lang = data.get("lang", DEFAULT_LANG)
+        kb = days_calendar_inline(data.get("calendar_days", []), page, lang)
+        await asyncio.gather(
+            state.set_data({**data, "day_page": page}),
+            mc.edit_inline(callback.message, t("client:booking:select_day", lang), kb),
+            callback.answer(),
+        )
 
     @router.callback_query(ClientBooking.day, F.data == "book:back_service")
     async def handle_back_to_service(callback: CallbackQuery, state: FSMContext):
         data = await state.get_data()
         lang = data.get("lang", DEFAULT_LANG)
         await state.set_state(ClientBooking.service)
-        kb = packages_list_inline(data.get("packages", []), 0, lang)
-        await callback.message.edit_text(text=t("client:booking:select_service", lang), reply_markup=kb)
-        await callback.answer()
+        kb = packages_list_inline(data.get("packages", []), data.get("pkg_page", 0), lang)
+        await asyncio.gather(
+            mc.edit_inline(callback.message, t("client:booking:select_service", lang), kb),
+            callback.answer(),
+        )
 
-    @router.callback_query(ClientBooking.day, F.data.startswith("book:day:"))
-    async def handle_day_select(callback: CallbackQuery, state: FSMContext):
-        date_str = callback.data.split(":")[-1]
+    @router.callback_query(ClientBooking.day, CallbackAction("book", "day"))
+    async def handle_day_select(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        date_str = cb[2]
         data = await state.get_data()
         lang = data.get("lang", DEFAULT_LANG)
         
         logger.info(f"[BOOKING] Day: {date_str}")
-        await state.update_data(selected_date=date_str)
         
         slots_data = await api.get_slots_day(
             data.get("location_id"),
@@ -335,39 +433,55 @@ def setup(menu_controller, get_user_context):
             return
         
         slots = slots_data.get("available_times", [])
-        await state.update_data(time_slots=slots)
-        await state.set_state(ClientBooking.time)
+        await asyncio.gather(
+            state.set_data({**data, "selected_date": date_str, "time_slots": slots, "time_page": 0}),
+            state.set_state(ClientBooking.time),
+        )
         
-        dt = datetime.strptime(date_str, "%Y-%m-%d")
         kb = time_slots_inline(slots, 0, lang)
-        await callback.message.edit_text(text=t("client:booking:select_time", lang) % dt.strftime("%d.%m.%Y"), reply_markup=kb)
-        await callback.answer()
+        await asyncio.gather(
+            mc.edit_inline(callback.message, t("client:booking:select_time", lang) % _date_display(date_str), kb),
+            callback.answer(),
+        )
 
     # ==========================================================
     # TIME
     # ==========================================================
 
-    @router.callback_query(ClientBooking.time, F.data.startswith("book:time_page:"))
-    async def handle_time_page(callback: CallbackQuery, state: FSMContext):
-        page = int(callback.data.split(":")[-1])
+    @router.callback_query(ClientBooking.time, CallbackAction("book", "time_page"))
+    async def handle_time_page(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
+        page = int(cb[2])
         data = await state.get_data()
-        kb = time_slots_inline(data.get("time_slots", []), page, data.get("lang", DEFAULT_LANG))
-        await callback.message.edit_reply_markup(reply_markup=kb)
-        await callback.answer()
+
+        # Повторный клик по уже показанной странице (двойной тап) — без edit
+        if data.get("time_page", 0) == page:
+            await callback.answer()
+            return
+
+        lang = data.get("lang", DEFAULT_LANG)
+        kb = time_slots_inline(data.get("time_slots", []), page, lang)
+        text = t("client:booking:select_time", lang) % _date_display(data.get("selected_date", "2026-01-01"))
+        await asyncio.gather(
+            state.set_data({**data, "time_page": page}),
+            mc.edit_inline(callback.message, text, kb),
+            callback.answer(),
+        )
 
     @router.callback_query(ClientBooking.time, F.data == "book:back_day")
     async def handle_back_to_day(callback: CallbackQuery, state: FSMContext):
         data = await state.get_data()
         lang = data.get("lang", DEFAULT_LANG)
         await state.set_state(ClientBooking.day)
-        kb = days_calendar_inline(data.get("calendar_days", []), 0, lang)
-        await callback.message.edit_text(text=t("client:booking:select_day", lang), reply_markup=kb)
-        await callback.answer()
+        kb = days_calendar_inline(data.get("calendar_days", []), data.get("day_page", 0), lang)
+        await asyncio.gather(
+            mc.edit_inline(callback.message, t("client:booking:select_day", lang), kb),
+            callback.answer(),
+        )
 
-    @router.callback_query(ClientBooking.time, F.data.startswith("book:time:"))
-    async def handle_time_select(callback: CallbackQuery, state: FSMContext):
+    @router.callback_query(ClientBooking.time, CallbackAction("book", "time"))
+    async def handle_time_select(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
         """Выбор времени → проверка количества специалистов."""
-        time_str = callback.data.replace("book:time:", "")  # "10:15"
+        time_str = time_from_cb(cb[2])  # "1015" → "10:15"
         data = await state.get_data()
         lang = data.get("lang", DEFAULT_LANG)
         slots = data.get("time_slots", [])
@@ -391,18 +505,16 @@ def setup(menu_controller, get_user_context):
             logger.info(f"[BOOKING] Time: {time_str}, specialists: {len(specialists)}")
             await state.set_state(ClientBooking.specialist)
             kb = specialists_select_inline(specialists, time_str, lang)
-            await callback.message.edit_text(
-                text=t("client:booking:select_specialist", lang) % time_str,
-                reply_markup=kb
+            await asyncio.gather(
+                mc.edit_inline(callback.message, t("client:booking:select_specialist", lang) % time_str, kb),
+                callback.answer(),
             )
-            await callback.answer()
             
-    @router.callback_query(ClientBooking.specialist, F.data.startswith("book:spec:"))
-    async def handle_specialist_select(callback: CallbackQuery, state: FSMContext):
+    @router.callback_query(ClientBooking.specialist, CallbackAction("book", "spec"))
+    async def handle_specialist_select(callback: CallbackQuery, state: FSMContext, cb: CallbackParts):
         """Выбор специалиста → phone gate → подтверждение."""
-        parts = callback.data.split(":")
-        time_str = f"{parts[2]}:{parts[3]}"
-        spec_id = int(parts[4])
+        time_str = time_from_cb(cb[2])
+        spec_id = int(cb[3])
         
         data = await state.get_data()
         lang = data.get("lang", DEFAULT_LANG)
@@ -421,15 +533,14 @@ def setup(menu_controller, get_user_context):
         """Назад к выбору времени из экрана специалиста."""
         data = await state.get_data()
         lang = data.get("lang", DEFAULT_LANG)
-        dt = datetime.strptime(data.get("selected_date", "2026-01-01"), "%Y-%m-%d")
+        date_display = _date_display(data.get("selected_date", "2026-01-01"))
         
         await state.set_state(ClientBooking.time)
-        kb = time_slots_inline(data.get("time_slots", []), 0, lang)
-        await callback.message.edit_text(
-            text=t("client:booking:select_time", lang) % dt.strftime("%d.%m.%Y"),
-            reply_markup=kb
+        kb = time_slots_inline(data.get("time_slots", []), data.get("time_page", 0), lang)
+        await asyncio.gather(
+            mc.edit_inline(callback.message, t("client:booking:select_time", lang) % date_display, kb),
+            callback.answer(),
         )
-        await callback.answer()
 
     # ==========================================================
     # PHONE GATE (перед подтверждением)
@@ -442,18 +553,17 @@ def setup(menu_controller, get_user_context):
         
         if await phone_required(user_id):
             logger.info(f"[BOOKING] Phone required for user_id={user_id}")
-            await state.set_state(ClientBooking.phone)
-            
-            try:
-                await callback.message.delete()
-            except Exception:
-                pass
-            
-            await callback.message.answer(
-                t("registration:welcome", lang),
-                reply_markup=request_phone_keyboard(lang)
+            # Reply-клавиатуру запроса контакта нельзя повесить через edit —
+            # нужен новый message; inline-сообщение удаляется в фоне
+            mc.delete_in_background(callback.message)
+            await asyncio.gather(
+                state.set_state(ClientBooking.phone),
+                callback.message.answer(
+                    t("registration:welcome", lang),
+                    reply_markup=request_phone_keyboard(lang)
+                ),
+                callback.answer(),
             )
-            await callback.answer()
         else:
             await show_confirmation(callback.message, state, lang)
             await callback.answer()
@@ -484,8 +594,8 @@ def setup(menu_controller, get_user_context):
     @router.message(ClientBooking.phone)
     async def handle_booking_phone_invalid(message: Message, state: FSMContext):
         """Пользователь отправил не Contact."""
-        data = await state.get_data()
-        await message.answer(t("registration:share_phone_hint", data.get("lang", DEFAULT_LANG)))
+        # Язык уже определён LangMiddleware — FSM ради него не читаем
+        await message.answer(t("registration:share_phone_hint", CURRENT_LANG.get()))
 
     # ==========================================================
     # CONFIRM
@@ -502,9 +612,8 @@ def setup(menu_controller, get_user_context):
         selected_time = data.get("selected_time", "")
         specialist_name = data.get("specialist_name", "?")
         
-        dt = datetime.strptime(selected_date, "%Y-%m-%d")
-        date_display = dt.strftime("%d.%m.%Y")
-        price_str = f"{int(service_price)}₽" if service_price == int(service_price) else f"{service_price:.0f}₽"
+        date_display = _date_display(selected_date)
+        price_str = format_price(service_price)
         
         text = t("client:booking:confirm_text", lang) % (
             service_name, date_display, selected_time, specialist_name, service_duration, price_str
@@ -526,7 +635,7 @@ def setup(menu_controller, get_user_context):
         datetime_str = f"{data.get('selected_date')}T{data.get('selected_time')}:00"
         duration = data.get("service_duration", 60)
         
-        dt_start = datetime.strptime(datetime_str, "%Y-%m-%dT%H:%M:%S")
+        dt_start = datetime.fromisoformat(datetime_str)
         dt_end = dt_start + timedelta(minutes=duration)
 
         logger.info(f"[BOOKING] Creating: user={data.get('user_id')}, datetime={datetime_str}")
@@ -543,20 +652,14 @@ def setup(menu_controller, get_user_context):
             notes="Telegram booking",
         )
 
-        if not booking:
-            await callback.answer(t("client:booking:error", lang), show_alert=True)
-            await state.clear()
-            from bot.app.keyboards.client import client_main
-            await mc.back_to_reply(callback.message, client_main(lang), title=t("client:main:title", lang))
-            return
-        
-        # Успех - короткий alert
-        await callback.answer(t("client:booking:success_alert", lang), show_alert=True)
-        await state.clear()
-        
-        # Возврат в главное меню
-        from bot.app.keyboards.client import client_main
-        await mc.back_to_reply(callback.message, client_main(lang), title=t("client:main:title", lang))
+        # Успех — короткий alert, ошибка — alert с ошибкой; в обоих случаях
+        # alert, сброс FSM и возврат в главное меню независимы — параллельно
+        alert_key = "client:booking:success_alert" if booking else "client:booking:error"
+        await asyncio.gather(
+            callback.answer(t(alert_key, lang), show_alert=True),
+            state.clear(),
+            mc.back_to_reply(callback.message, client_main(lang), title=t("client:main:title", lang)),
+        )
 
     # ==========================================================
     # CANCEL
@@ -564,12 +667,12 @@ def setup(menu_controller, get_user_context):
 
     @router.callback_query(F.data == "book:cancel")
     async def handle_cancel(callback: CallbackQuery, state: FSMContext):
-        data = await state.get_data()
-        lang = data.get("lang", DEFAULT_LANG)
-        await callback.answer(t("client:booking:cancelled", lang), show_alert=True)
-        await state.clear()
-        from bot.app.keyboards.client import client_main
-        await mc.back_to_reply(callback.message, client_main(lang), title=t("client:main:title", lang))
+        lang = CURRENT_LANG.get()
+        await asyncio.gather(
+            callback.answer(t("client:booking:cancelled", lang), show_alert=True),
+            state.clear(),
+            mc.back_to_reply(callback.message, client_main(lang), title=t("client:main:title", lang)),
+        )
 
     @router.callback_query(F.data == "book:noop")
     async def handle_noop(callback: CallbackQuery):
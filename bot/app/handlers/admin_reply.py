@@ -55,44 +55,44 @@ def setup(menu_controller, get_user_role):
     # Ключи i18n: admin:{context}:{action}
     # Пример: admin:locations:list, admin:services:create
     #
-    # handler(msg, state) — для обычных действий
-    # handler(msg, state, lang) — для back (нужен lang)
+    # handler(msg, state, lang) — lang передаётся явно: reply_router не входит
+    # в роутеры flow, и LangMiddleware для него CURRENT_LANG не выставляет
     # ==========================================================
     
     context_handlers = {
         "locations": {
-            "list": lambda msg, st: loc_router.show_list(msg),
-            "create": lambda msg, st: loc_router.start_create(msg, st),
+            "list": lambda msg, st, lang: loc_router.show_list(msg),
+            "create": lambda msg, st, lang: loc_router.start_create(msg, st),
             "back": lambda msg, st, lang: flow.back_to_settings(msg, lang),
         },
         "services": {
-            "list": lambda msg, st: svc_router.show_list(msg),
-            "create": lambda msg, st: svc_router.start_create(msg, st),
+            "list": lambda msg, st, lang: svc_router.show_list(msg, lang),
+            "create": lambda msg, st, lang: svc_router.start_create(msg, st, lang),
             "back": lambda msg, st, lang: flow.back_to_settings(msg, lang),
         },
         "packages": {
-            "list": lambda msg, st: pkg_router.show_list(msg),
-            "create": lambda msg, st: pkg_router.start_create(msg, st),
+            "list": lambda msg, st, lang: pkg_router.show_list(msg),
+            "create": lambda msg, st, lang: pkg_router.start_create(msg, st),
             "back": lambda msg, st, lang: flow.back_to_settings(msg, lang),
         },
         "rooms": {
-            "list": lambda msg, st: room_router.show_list(msg),
-            "create": lambda msg, st: room_router.start_create(msg, st),
+            "list": lambda msg, st, lang: room_router.show_list(msg),
+            "create": lambda msg, st, lang: room_router.start_create(msg, st),
             "back": lambda msg, st, lang: flow.back_to_settings(msg, lang),
         },
         "specialists": {
-            "list": lambda msg, st: spec_router.show_list(msg),
-            "create": lambda msg, st: spec_router.start_create(msg, st),
+            "list": lambda msg, st, lang: spec_router.show_list(msg, lang),
+            "create": lambda msg, st, lang: spec_router.start_create(msg, st, lang),
             "back": lambda msg, st, lang: flow.back_to_settings(msg, lang),
         },
         "schedule": {
-            "bookings": lambda msg, st: schedule_router.show_bookings(msg),
-            "overrides": lambda msg, st: schedule_router.show_overrides(msg, st),
+            "bookings": lambda msg, st, lang: schedule_router.show_bookings(msg),
+            "overrides": lambda msg, st, lang: schedule_router.show_overrides(msg, st),
             "back": lambda msg, st, lang: flow.back_to_main(msg, lang),
         },
         "clients": {
-            "find": lambda msg, st: clients_router.start_search(msg, st),
-            "bookings": lambda msg, st: clients_router.show_bookings_list(msg),
+            "find": lambda msg, st, lang: clients_router.start_search(msg, st),
+            "bookings": lambda msg, st, lang: clients_router.show_bookings_list(msg),
             "back": lambda msg, st, lang: flow.back_to_main(msg, lang),
         },
     }
@@ -160,10 +160,7 @@ def setup(menu_controller, get_user_role):
                 key = f"admin:{menu_ctx}:{action}"
                 
                 if text == t(key, lang):
-                    if action == "back":
-                        await handler(message, state, lang)
-                    else:
-                        await handler(message, state)
+                    await handler(message, state, lang)
                     return
 
         # ==============================================================
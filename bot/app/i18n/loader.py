@@ -1,12 +1,20 @@
 import re
+import sys
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Dict, Set, List
+from typing import Dict, Set
 
 MESSAGES: Dict[str, Dict[str, str]] = {}
 AVAILABLE_LANGS: Set[str] = set()
 
+# lang -> {key: text} с уже применённым fallback на DEFAULT_LANG (строится в load_messages)
+_RESOLVED: Dict[str, Dict[str, str]] = {}
+
 DEFAULT_LANG = "ru"
 
+# Язык текущего апдейта (выставляет LangMiddleware)
+CURRENT_LANG: ContextVar[str] = ContextVar("current_lang", default=DEFAULT_LANG)
+
 LINE_RE = re.compile(r'^(\w+):([^|]+)\|\s*"(.*)"$')
 
 
@@ -15,6 +23,7 @@ def load_messages(path: str | Path):
 
     MESSAGES.clear()
     AVAILABLE_LANGS.clear()
+    _RESOLVED.clear()
 
     path = Path(path)
     if not path.exists():
@@ -32,19 +41,22 @@ def load_messages(path: str | Path):
         lang, key, text = m.groups()
         text = text.replace("\\n", "\n").strip()
 
-        MESSAGES.setdefault(lang, {})[key.strip()] = text
+        MESSAGES.setdefault(lang, {})[sys.intern(key.strip())] = sys.intern(text)
         AVAILABLE_LANGS.add(lang)
 
+    # Пустые тексты не перекрывают fallback (как `or` в прежнем t())
+    default = {k: v for k, v in MESSAGES.get(DEFAULT_LANG, {}).items() if v}
+    for lang, messages in MESSAGES.items():
+        _RESOLVED[lang] = {**default, **{k: v for k, v in messages.items() if v}}
+
 
 def t(key: str, lang: str | None = None, *args) -> str:
     if not lang:
-        lang = DEFAULT_LANG
+        lang = CURRENT_LANG.get()
 
-    text = (
-        MESSAGES.get(lang, {}).get(key)
-        or MESSAGES.get(DEFAULT_LANG, {}).get(key)
-        or key
-    )
+    # Один lookup: fallback на DEFAULT_LANG уже вшит в _RESOLVED
+    messages = _RESOLVED.get(lang) or _RESOLVED.get(DEFAULT_LANG, {})
+    text = messages.get(key, key)
 
     if args:
         try:
@@ -55,21 +67,20 @@ def t(key: str, lang: str | None = None, *args) -> str:
     return text
 
 
-def t_all(key: str) -> List[str]:
+def t_all(key: str) -> frozenset[str]:
     """
-    Возвращает список всех переводов ключа для всех доступных языков.
+    Возвращает множество всех переводов ключа для всех доступных языков.
     
     Использование в фильтрах:
         @router.message(F.text.in_(t_all("admin:rooms:back")))
     
-    включает все языки 
+    включает все языки; frozenset → проверка `in` за O(1)
     """
-    translations = []
-    for lang in AVAILABLE_LANGS:
-        text = MESSAGES.get(lang, {}).get(key)
-        if text and text not in translations:
-            translations.append(text)
-    return translations
+    return frozenset(
+        text
+        for lang in AVAILABLE_LANGS
+        if (text := MESSAGES.get(lang, {}).get(key))
+    )
 
 
 def get_available_langs() -> list[str]:
@@ -0,0 +1,49 @@
+"""
+bot/app/i18n/middleware.py
+
+Язык пользователя — один раз на апдейт.
+
+user_lang.get() — запрос в Redis; middleware делает его один раз
+и кладёт результат в CURRENT_LANG. Хэндлеры читают язык через
+CURRENT_LANG.get(), а t(key) без lang берёт его же.
+
+Подключается через use_lang_middleware(router) только к роутерам flow,
+которые читают CURRENT_LANG, и как inner middleware: GET выполняется,
+только когда апдейт дошёл до хэндлера такого роутера (или его вложенных).
+Flow, которые сами вызывают user_lang.get(), лишнего GET не получают.
+"""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from aiogram import BaseMiddleware, Router
+from aiogram.types import TelegramObject, User
+
+from bot.app.i18n.loader import CURRENT_LANG, DEFAULT_LANG
+from bot.app.utils.state import user_lang
+
+
+class LangMiddleware(BaseMiddleware):
+    """Inner middleware для message / callback_query."""
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        user: User | None = data.get("event_from_user")
+        lang = user_lang.get(user.id, DEFAULT_LANG) if user else DEFAULT_LANG
+
+        token = CURRENT_LANG.set(lang)
+        try:
+            return await handler(event, data)
+        finally:
+            CURRENT_LANG.reset(token)
+
+
+def use_lang_middleware(router: Router) -> None:
+    """Подключить LangMiddleware к message / callback_query роутера (и вложенных)."""
+    middleware = LangMiddleware()
+    router.message.middleware(middleware)
+    router.callback_query.middleware(middleware)
@@ -1,5 +1,7 @@
 # bot/app/main.py
 
+import functools
+import json
 import logging
 import os
 from dataclasses import dataclass
@@ -22,6 +24,7 @@ from bot.app.keyboards.admin import admin_main
 from bot.app.keyboards.client import client_main
 from bot.app.keyboards.common import language_inline
 from bot.app.utils.api import api
+from bot.app.utils.callback import CallbackParseMiddleware
 from bot.app.utils.menucontroller import MenuController
 from bot.app.utils.state import user_lang
 
@@ -38,7 +41,12 @@ REDIS_URL = os.getenv("REDIS_URL")
 if not REDIS_URL:
     raise RuntimeError("REDIS_URL is not set")
 
-storage = RedisStorage.from_url(REDIS_URL)
+# Компактный JSON для FSM data: без пробелов и без \uXXXX-экранирования
+# кириллицы (UTF-8 в ~3 раза короче). Старые записи читаются как раньше.
+storage = RedisStorage.from_url(
+    REDIS_URL,
+    json_dumps=functools.partial(json.dumps, ensure_ascii=False, separators=(",", ":")),
+)
 
 if TG_PROXY_URL:
     from aiogram.client.session.aiohttp import AiohttpSession  # noqa: E402
@@ -74,6 +82,9 @@ else:
     bot = Bot(token=BOT_TOKEN)
 dp = Dispatcher(storage=storage)
 
+# callback.data разбирается один раз → handlers получают `cb`
+dp.callback_query.outer_middleware(CallbackParseMiddleware())
+
 menu = MenuController()
 admin_flow = AdminMenuFlow(menu)
 client_flow = ClientMenuFlow(menu)
@@ -6,9 +6,12 @@ HTTP-клиент для запросов в Backend напрямую.
 Bot — доверенный internal компонент, не нуждается в gateway proxy.
 """
 
+import asyncio
 import os
 import logging
-from typing import Optional
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, Optional
 
 import httpx
 
@@ -17,17 +20,46 @@ logger = logging.getLogger(__name__)
 # Backend URL — бот ходит НАПРЯМУЮ в backend (не через gateway)
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
 
+# Максимум одновременных запросов в backend (защита от burst)
+MAX_CONCURRENT_REQUESTS = 20
+
+# TTL кэша справочника услуг (сек). Изменения через бота сбрасывают кэш сразу.
+SERVICES_CACHE_TTL = 60.0
+
+# Списки пользователей и специалистов меняются и вне бота (регистрация, web) —
+# TTL короче, изменения через бота сбрасывают кэш сразу.
+USERS_CACHE_TTL = 15.0
+SPECIALISTS_CACHE_TTL = 15.0
+
+# Локации и пакеты тоже меняются редко (цена пакета считается из цен услуг —
+# изменения услуг сбрасывают и кэш пакетов)
+LOCATIONS_CACHE_TTL = 60.0
+PACKAGES_CACHE_TTL = 60.0
+
+# Сколько помнить 404 по id (старые кнопки в истории чата на удалённые записи)
+NOT_FOUND_CACHE_TTL = 5.0
+
 
 class ApiClient:
     """
     Асинхронный клиент для API.
     
     Использует persistent connection pool для эффективности.
+    Количество одновременных запросов ограничено семафором.
     """
 
     def __init__(self, base_url: str = BACKEND_URL):
         self.base_url = base_url.rstrip("/")
         self._client: httpx.AsyncClient | None = None
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # key -> (expires_at, value)
+        self._cache: dict[str, tuple[float, Any]] = {}
+        self._cache_locks: dict[str, asyncio.Lock] = {}
+        # key -> поколение; invalidate() увеличивает, чтобы запрос, начатый до
+        # изменения, не положил в кэш старые данные
+        self._cache_gen: dict[str, int] = {}
+        # key -> (исходный список, {id: item}) — карта пересобирается только при смене списка
+        self._id_maps: dict[str, tuple[list[dict] | None, dict[int, dict]]] = {}
         logger.info(f"ApiClient initialized with base_url: {self.base_url}")
 
     async def _get_client(self) -> httpx.AsyncClient:
@@ -38,9 +70,9 @@ class ApiClient:
                 timeout=10.0,
                 follow_redirects=True,
                 limits=httpx.Limits(
-                    max_connections=20,
-                    max_keepalive_connections=10,
-                    keepalive_expiry=30.0,
+                    max_connections=MAX_CONCURRENT_REQUESTS,
+                    max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+                    keepalive_expiry=60.0,
                 ),
             )
             logger.info("Created new httpx.AsyncClient")
@@ -63,7 +95,8 @@ class ApiClient:
         client = await self._get_client()
         
         try:
-            resp = await client.request(method, path, **kwargs)
+            async with self._semaphore:
+                resp = await client.request(method, path, **kwargs)
             
             if resp.status_code == 204:
                 return None
@@ -78,6 +111,62 @@ class ApiClient:
             logger.error(f"API request failed: {method} {path} -> {e}")
             return None
 
+    async def _cached(
+        self,
+        key: str,
+        ttl: float,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        TTL-кэш для редко меняющихся справочников.
+
+        Ошибки (None) не кэшируются. Параллельные промахи по одному ключу
+        ждут один запрос, а не идут в backend каждый. Если во время запроса
+        ключ был сброшен invalidate(), ответ возвращается, но не кэшируется.
+        """
+        entry = self._cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+
+            gen = self._cache_gen.get(key, 0)
+            value = await fetch()
+            if value is not None and self._cache_gen.get(key, 0) == gen:
+                self._cache[key] = (time.monotonic() + ttl, value)
+            return value
+
+    def _id_map(self, key: str, items: list[dict]) -> dict[int, dict]:
+        """{id: item} для кэшированного списка; общий объект — не мутировать."""
+        source, id_map = self._id_maps.get(key, (None, {}))
+        if source is not items:
+            id_map = {item["id"]: item for item in items}
+            self._id_maps[key] = (items, id_map)
+        return id_map
+
+    def _is_known_missing(self, key: str) -> bool:
+        """Недавно получили 404 по key — повторно в backend не ходим."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return False
+        if entry[0] > time.monotonic():
+            return True
+        del self._cache[key]
+        return False
+
+    def _remember_missing(self, key: str) -> None:
+        self._cache[key] = (time.monotonic() + NOT_FOUND_CACHE_TTL, None)
+
+    def invalidate(self, *keys: str) -> None:
+        """Сбросить кэш справочников (после изменений)."""
+        for key in keys:
+            self._cache.pop(key, None)
+            self._cache_gen[key] = self._cache_gen.get(key, 0) + 1
+
     async def _request_with_status(
         self,
         method: str,
@@ -88,7 +177,8 @@ class ApiClient:
         client = await self._get_client()
         
         try:
-            resp = await client.request(method, path, **kwargs)
+            async with self._semaphore:
+                resp = await client.request(method, path, **kwargs)
             
             if resp.status_code == 204:
                 return None, 204
@@ -119,8 +209,16 @@ class ApiClient:
     # ------------------------------------------------------------------
 
     async def get_locations(self) -> list[dict]:
-        """GET /locations/ — список активных локаций."""
-        result = await self._request("GET", "/locations/")
+        """
+        GET /locations/ — список активных локаций.
+
+        Кэшируется на LOCATIONS_CACHE_TTL. Список общий — не мутировать.
+        """
+        result = await self._cached(
+            "locations",
+            LOCATIONS_CACHE_TTL,
+            lambda: self._request("GET", "/locations/"),
+        )
         return result or []
 
     async def get_location(self, location_id: int) -> Optional[dict]:
@@ -141,15 +239,20 @@ class ApiClient:
             "city": city,
             **kwargs
         }
-        return await self._request("POST", "/locations/", json=data)
+        result = await self._request("POST", "/locations/", json=data)
+        self.invalidate("locations")
+        return result
 
     async def update_location(self, location_id: int, **kwargs) -> Optional[dict]:
         """PATCH /locations/{id}"""
-        return await self._request("PATCH", f"/locations/{location_id}", json=kwargs)
+        result = await self._request("PATCH", f"/locations/{location_id}", json=kwargs)
+        self.invalidate("locations")
+        return result
 
     async def delete_location(self, location_id: int) -> bool:
         """DELETE /locations/{id} — soft-delete."""
         result = await self._request("DELETE", f"/locations/{location_id}")
+        self.invalidate("locations")
         return result is None
 
     # ------------------------------------------------------------------
@@ -157,10 +260,22 @@ class ApiClient:
     # ------------------------------------------------------------------
 
     async def get_services(self) -> list[dict]:
-        """GET /services/ — список активных услуг."""
-        result = await self._request("GET", "/services/")
+        """
+        GET /services/ — список активных услуг.
+
+        Кэшируется на SERVICES_CACHE_TTL. Список общий — не мутировать.
+        """
+        result = await self._cached(
+            "services",
+            SERVICES_CACHE_TTL,
+            lambda: self._request("GET", "/services/"),
+        )
         return result or []
 
+    async def get_services_map(self) -> dict[int, dict]:
+        """{service_id: service} поверх get_services() — пересобирается только при смене списка."""
+        return self._id_map("services", await self.get_services())
+
     async def get_service(self, service_id: int) -> Optional[dict]:
         """GET /services/{id}"""
         return await self._request("GET", f"/services/{service_id}")
@@ -181,15 +296,20 @@ class ApiClient:
             "price": price,
             **kwargs
         }
-        return await self._request("POST", "/services/", json=data)
+        result = await self._request("POST", "/services/", json=data)
+        self.invalidate("services", "packages")
+        return result
 
     async def update_service(self, service_id: int, **kwargs) -> Optional[dict]:
         """PATCH /services/{id}"""
-        return await self._request("PATCH", f"/services/{service_id}", json=kwargs)
+        result = await self._request("PATCH", f"/services/{service_id}", json=kwargs)
+        self.invalidate("services", "packages")
+        return result
 
     async def delete_service(self, service_id: int) -> bool:
         """DELETE /services/{id} — soft-delete."""
         result = await self._request("DELETE", f"/services/{service_id}")
+        self.invalidate("services", "packages")
         return result is None
 
     # ------------------------------------------------------------------
@@ -197,8 +317,16 @@ class ApiClient:
     # ------------------------------------------------------------------
     
     async def get_packages(self) -> list[dict]:
-        """GET /service_packages/ — список пакетов услуг."""
-        result = await self._request("GET", "/service_packages/")
+        """
+        GET /service_packages/ — список пакетов услуг.
+
+        Кэшируется на PACKAGES_CACHE_TTL. Список общий — не мутировать.
+        """
+        result = await self._cached(
+            "packages",
+            PACKAGES_CACHE_TTL,
+            lambda: self._request("GET", "/service_packages/"),
+        )
         return result or []
     
     async def get_package(self, package_id: int) -> Optional[dict]:
@@ -207,15 +335,20 @@ class ApiClient:
     
     async def create_package(self, data: dict) -> Optional[dict]:
         """POST /service_packages/"""
-        return await self._request("POST", "/service_packages/", json=data)
+        result = await self._request("POST", "/service_packages/", json=data)
+        self.invalidate("packages")
+        return result
     
     async def patch_package(self, package_id: int, data: dict) -> Optional[dict]:
         """PATCH /service_packages/{id}"""
-        return await self._request("PATCH", f"/service_packages/{package_id}", json=data)
+        result = await self._request("PATCH", f"/service_packages/{package_id}", json=data)
+        self.invalidate("packages")
+        return result
     
     async def delete_package(self, package_id: int) -> bool:
         """DELETE /service_packages/{id} — soft-delete."""
         result = await self._request("DELETE", f"/service_packages/{package_id}")
+        self.invalidate("packages")
         return result is None
 
     # ------------------------------------------------------------------
@@ -296,10 +429,22 @@ class ApiClient:
     # ------------------------------------------------------------------
 
     async def get_users(self) -> list[dict]:
-        """GET /users/ — список активных пользователей."""
-        result = await self._request("GET", "/users/")
+        """
+        GET /users/ — список активных пользователей.
+
+        Кэшируется на USERS_CACHE_TTL. Список общий — не мутировать.
+        """
+        result = await self._cached(
+            "users",
+            USERS_CACHE_TTL,
+            lambda: self._request("GET", "/users/"),
+        )
         return result or []
 
+    async def get_users_map(self) -> dict[int, dict]:
+        """{user_id: user} поверх get_users() — пересобирается только при смене списка."""
+        return self._id_map("users", await self.get_users())
+
     async def search_users(self, q: str, limit: int = 20) -> list[dict]:
         """
         GET /users/search — поиск пользователей.
@@ -371,11 +516,13 @@ class ApiClient:
                 "new_role": "specialist"
             }
         """
-        return await self._request(
+        result = await self._request(
             "PATCH",
             f"/users/{user_id}/role",
             json={"role": role}
         )
+        self.invalidate("users")
+        return result
 
     async def create_user(
         self,
@@ -399,15 +546,20 @@ class ApiClient:
         if tg_id:
             data["tg_id"] = tg_id
             
-        return await self._request("POST", "/users/", json=data)
+        result = await self._request("POST", "/users/", json=data)
+        self.invalidate("users")
+        return result
 
     async def update_user(self, user_id: int, **kwargs) -> Optional[dict]:
         """PATCH /users/{id} — обновление пользователя."""
-        return await self._request("PATCH", f"/users/{user_id}", json=kwargs)
+        result = await self._request("PATCH", f"/users/{user_id}", json=kwargs)
+        self.invalidate("users")
+        return result
 
     async def delete_user(self, user_id: int) -> bool:
         """DELETE /users/{id} — soft-delete (деактивация)."""
         result = await self._request("DELETE", f"/users/{user_id}")
+        self.invalidate("users")
         return result is None
 
     # ------------------------------------------------------------------
@@ -427,13 +579,33 @@ class ApiClient:
     # ------------------------------------------------------------------
 
     async def get_specialists(self) -> list[dict]:
-        """GET /specialists/ — список активных специалистов."""
-        result = await self._request("GET", "/specialists/")
+        """
+        GET /specialists/ — список активных специалистов.
+
+        Кэшируется на SPECIALISTS_CACHE_TTL. Список общий — не мутировать.
+        """
+        result = await self._cached(
+            "specialists",
+            SPECIALISTS_CACHE_TTL,
+            lambda: self._request("GET", "/specialists/"),
+        )
         return result or []
 
     async def get_specialist(self, specialist_id: int) -> Optional[dict]:
-        """GET /specialists/{id}"""
-        return await self._request("GET", f"/specialists/{specialist_id}")
+        """
+        GET /specialists/{id}
+
+        404 запоминается на NOT_FOUND_CACHE_TTL: клики по кнопкам удалённого
+        специалиста не долбят backend. Ошибки (не 404) не кэшируются.
+        """
+        missing_key = f"specialist_missing:{specialist_id}"
+        if self._is_known_missing(missing_key):
+            return None
+
+        result, status = await self._request_with_status("GET", f"/specialists/{specialist_id}")
+        if status == 404:
+            self._remember_missing(missing_key)
+        return result
 
     async def create_specialist(
         self,
@@ -445,15 +617,20 @@ class ApiClient:
             "user_id": user_id,
             **kwargs
         }
-        return await self._request("POST", "/specialists/", json=data)
+        result = await self._request("POST", "/specialists/", json=data)
+        self.invalidate("specialists")
+        return result
 
     async def update_specialist(self, specialist_id: int, **kwargs) -> Optional[dict]:
         """PATCH /specialists/{id}"""
-        return await self._request("PATCH", f"/specialists/{specialist_id}", json=kwargs)
+        result = await self._request("PATCH", f"/specialists/{specialist_id}", json=kwargs)
+        self.invalidate("specialists", f"specialist_missing:{specialist_id}")
+        return result
 
     async def delete_specialist(self, specialist_id: int) -> bool:
         """DELETE /specialists/{id} — soft-delete."""
         result = await self._request("DELETE", f"/specialists/{specialist_id}")
+        self.invalidate("specialists", f"specialist_services:{specialist_id}")
         return result is None
 
     # ------------------------------------------------------------------
@@ -461,8 +638,16 @@ class ApiClient:
     # ------------------------------------------------------------------
 
     async def get_specialist_services(self, specialist_id: int) -> list[dict]:
-        """GET /specialists/{id}/services — услуги специалиста."""
-        result = await self._request("GET", f"/specialists/{specialist_id}/services")
+        """
+        GET /specialists/{id}/services — услуги специалиста.
+
+        Кэшируется на SPECIALISTS_CACHE_TTL. Список общий — не мутировать.
+        """
+        result = await self._cached(
+            f"specialist_services:{specialist_id}",
+            SPECIALISTS_CACHE_TTL,
+            lambda: self._request("GET", f"/specialists/{specialist_id}/services"),
+        )
         return result or []
 
     async def add_specialist_service(
@@ -476,7 +661,9 @@ class ApiClient:
             "service_id": service_id,
             **kwargs
         }
-        return await self._request("POST", f"/specialists/{specialist_id}/services", json=data)
+        result = await self._request("POST", f"/specialists/{specialist_id}/services", json=data)
+        self.invalidate(f"specialist_services:{specialist_id}")
+        return result
 
     async def update_specialist_service(
         self,
@@ -485,11 +672,13 @@ class ApiClient:
         **kwargs
     ) -> Optional[dict]:
         """PATCH /specialists/{id}/services/{service_id}"""
-        return await self._request(
+        result = await self._request(
             "PATCH",
             f"/specialists/{specialist_id}/services/{service_id}",
             json=kwargs
         )
+        self.invalidate(f"specialist_services:{specialist_id}")
+        return result
 
     async def delete_specialist_service(
         self,
@@ -501,6 +690,7 @@ class ApiClient:
             "DELETE",
             f"/specialists/{specialist_id}/services/{service_id}"
         )
+        self.invalidate(f"specialist_services:{specialist_id}")
         return result is None
 
     # ------------------------------------------------------------------
@@ -899,11 +1089,14 @@ class ApiClient:
 
     async def update_user(self, user_id: int, **kwargs) -> Optional[dict]:
         """PATCH /users/{id}"""
-        return await self._request("PATCH", f"/users/{user_id}", json=kwargs)
+        result = await self._request("PATCH", f"/users/{user_id}", json=kwargs)
+        self.invalidate("users")
+        return result
 
     async def delete_user(self, user_id: int) -> bool:
         """DELETE /users/{id} — soft-delete (is_active=0)."""
         result = await self._request("DELETE", f"/users/{user_id}")
+        self.invalidate("users")
         return result is None
 
     async def search_users(self, query: str, limit: int = 20) -> list[dict]:
@@ -960,11 +1153,13 @@ class ApiClient:
                 "new_role": "specialist"
             }
         """
-        return await self._request(
+        result = await self._request(
             "PATCH",
             f"/users/{user_id}/role",
             json={"role": new_role}
         )
+        self.invalidate("users")
+        return result
 
     # ------------------------------------------------------------------
     # User Roles (for reading only, changes via /users/{id}/role)
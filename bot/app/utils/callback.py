@@ -0,0 +1,63 @@
+"""
+bot/app/utils/callback.py
+
+Разбор callback_data один раз на апдейт.
+
+Middleware кладёт в data["cb"] кортеж частей callback_data:
+    "svc:view:12"        → ("svc", "view", "12")
+    "svc:color:12:red"   → ("svc", "color", "12", "red")
+
+Хэндлер получает его аргументом `cb` и не делает split повторно:
+    async def view(callback: CallbackQuery, cb: CallbackParts):
+        svc_id = int(cb[2])
+"""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from aiogram import BaseMiddleware
+from aiogram.filters import BaseFilter
+from aiogram.types import CallbackQuery, TelegramObject
+
+CallbackParts = tuple[str, ...]
+
+# ns:action:arg:rest — остаток после 3-го ":" не дробится
+CALLBACK_MAXSPLIT = 3
+
+
+def parse_callback(data: str | None) -> CallbackParts:
+    """Разбить callback_data на части (не более CALLBACK_MAXSPLIT + 1)."""
+    if not data:
+        return ()
+    return tuple(data.split(":", CALLBACK_MAXSPLIT))
+
+
+class CallbackParseMiddleware(BaseMiddleware):
+    """Outer middleware для callback_query: парсит callback.data в data["cb"]."""
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        if isinstance(event, CallbackQuery):
+            data["cb"] = parse_callback(event.data)
+        return await handler(event, data)
+
+
+class CallbackAction(BaseFilter):
+    """
+    Фильтр по namespace + action из уже разобранного `cb`.
+
+        @router.callback_query(CallbackAction("svc", "edit_name", "edit_desc"))
+
+    Одна проверка по множеству вместо цепочки F.data.startswith(...).
+    """
+
+    def __init__(self, ns: str, *actions: str):
+        self.ns = ns
+        self.actions = frozenset(actions)
+
+    async def __call__(self, callback: CallbackQuery, cb: CallbackParts) -> bool:
+        return len(cb) > 1 and cb[0] == self.ns and cb[1] in self.actions
@@ -0,0 +1,10 @@
+"""
+bot/app/utils/formatters.py
+
+Общие форматтеры для текстов бота.
+"""
+
+
+def user_full_name(user: dict) -> str:
+    """«Имя Фамилия» пользователя; пустые части пропускаются, без имени — «?»."""
+    return " ".join(part for part in (user.get("first_name"), user.get("last_name")) if part) or "?"
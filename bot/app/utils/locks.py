@@ -0,0 +1,58 @@
+"""
+bot/app/utils/locks.py
+
+Per-key asyncio.Lock для хэндлеров, которые пишут в backend.
+
+Двойной тап по кнопке (медленная сеть) приходит двумя апдейтами,
+которые aiogram обрабатывает параллельно. Лок по tg_id сериализует их:
+
+    async with user_locks.get(callback.from_user.id):
+        ...
+
+Неиспользуемые локи периодически удаляются, чтобы словарь не рос
+с числом пользователей.
+"""
+
+import asyncio
+import time
+from collections.abc import Hashable
+
+# Раз в сколько секунд чистить словарь и сколько лок может простаивать
+LOCK_SWEEP_INTERVAL = 60.0
+LOCK_IDLE_TTL = 60.0
+
+
+class LockManager:
+    """Словарь key → asyncio.Lock с очисткой простаивающих локов."""
+
+    def __init__(self, idle_ttl: float = LOCK_IDLE_TTL, sweep_interval: float = LOCK_SWEEP_INTERVAL):
+        self._idle_ttl = idle_ttl
+        self._sweep_interval = sweep_interval
+        # key -> (lock, last_touch)
+        self._locks: dict[Hashable, tuple[asyncio.Lock, float]] = {}
+        self._sweep_at = time.monotonic() + sweep_interval
+
+    def get(self, key: Hashable) -> asyncio.Lock:
+        """Лок для key (создаётся при первом обращении)."""
+        now = time.monotonic()
+        if now >= self._sweep_at:
+            self._sweep(now)
+
+        entry = self._locks.get(key)
+        lock = entry[0] if entry else asyncio.Lock()
+        self._locks[key] = (lock, now)
+        return lock
+
+    def _sweep(self, now: float) -> None:
+        """Удалить свободные локи, к которым не обращались дольше idle_ttl."""
+        deadline = now - self._idle_ttl
+        self._locks = {
+            key: (lock, touched)
+            for key, (lock, touched) in self._locks.items()
+            if lock.locked() or touched > deadline
+        }
+        self._sweep_at = now + self._sweep_interval
+
+
+# Общий менеджер для хэндлеров: ключ — tg_id пользователя
+user_locks = LockManager()
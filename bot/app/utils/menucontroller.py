@@ -5,8 +5,10 @@ UI-контроллер навигации Telegram-бота.
 DEBUG VERSION - добавлено логирование для диагностики.
 """
 
+import asyncio
 import logging
 import os
+from collections import OrderedDict
 
 import redis.asyncio as redis
 from aiogram.exceptions import TelegramBadRequest
@@ -14,6 +16,12 @@ from aiogram.types import InlineKeyboardMarkup, Message, ReplyKeyboardMarkup
 
 logger = logging.getLogger(__name__)
 
+# Сколько последних отрисовок inline-сообщений помнить (для пропуска no-op edit)
+RENDER_CACHE_SIZE = 512
+
+# Сильные ссылки на фоновые задачи (иначе их может собрать GC до завершения)
+_BG_TASKS: set[asyncio.Task] = set()
+
 
 class MenuController:
     """
@@ -25,7 +33,8 @@ class MenuController:
         if not redis_url:
             raise RuntimeError("REDIS_URL is not set")
         self.redis = redis.from_url(redis_url, decode_responses=True)
-        logger.info(f"MenuController initialized with redis_url: {redis_url[:20]}...")
+        self._last_render: OrderedDict[tuple[int, int], int] = OrderedDict()
+        logger.info("MenuController initialized with redis_url: %s...", redis_url[:20])
 
     # ------------------------------------------------------------------
     # Redis keys
@@ -81,6 +90,45 @@ class MenuController:
     async def _clear_inline_ids(self, chat_id: int) -> None:
         await self.redis.delete(self._inline_key(chat_id))
 
+    # ------------------------------------------------------------------
+    # Render signatures (skip unchanged edits)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _render_sig(text: str, kb: InlineKeyboardMarkup, parse_mode: str | None) -> int:
+        return hash((text, parse_mode, kb.model_dump_json(exclude_none=True)))
+
+    def _is_unchanged(self, message: Message, sig: int) -> bool:
+        key = (message.chat.id, message.message_id)
+        if self._last_render.get(key) == sig:
+            self._last_render.move_to_end(key)
+            return True
+        return False
+
+    def _remember_render(self, message: Message, sig: int) -> None:
+        key = (message.chat.id, message.message_id)
+        self._last_render[key] = sig
+        self._last_render.move_to_end(key)
+        if len(self._last_render) > RENDER_CACHE_SIZE:
+            self._last_render.popitem(last=False)
+
+    def forget_render(self, message: Message) -> None:
+        """
+        Сбросить запомненную отрисовку сообщения.
+
+        Вызывать после правки сообщения мимо edit_inline (message.edit_text,
+        bot.edit_message_text, ...): иначе возврат к прежнему экрану через
+        edit_inline совпадёт со старой сигнатурой и будет пропущен.
+        """
+        self._last_render.pop((message.chat.id, message.message_id), None)
+
+    def _after_edit_error(self, message: Message, sig: int, e: TelegramBadRequest) -> None:
+        """Не-изменённое сообщение уже показывает sig; при другой ошибке содержимое неизвестно."""
+        if "message is not modified" in str(e):
+            self._remember_render(message, sig)
+        else:
+            self.forget_render(message)
+
     # ------------------------------------------------------------------
     # Global reset (for /start)
     # ------------------------------------------------------------------
@@ -89,17 +137,17 @@ class MenuController:
         """
         Полный сброс навигационного состояния чата.
         """
-        logger.info(f"[RESET] Starting reset for chat_id={chat_id}")
+        logger.debug("[RESET] Starting reset for chat_id=%s", chat_id)
         try:
             await self._del_menu_id(chat_id)
-            logger.info(f"[RESET] Deleted menu_id")
+            logger.debug("[RESET] Deleted menu_id")
             await self._clear_inline_ids(chat_id)
-            logger.info(f"[RESET] Cleared inline_ids")
+            logger.debug("[RESET] Cleared inline_ids")
             await self.clear_menu_context(chat_id)
-            logger.info(f"[RESET] Cleared menu_context")
-            logger.info(f"[RESET] Complete for chat_id={chat_id}")
+            logger.debug("[RESET] Cleared menu_context")
+            logger.debug("[RESET] Complete for chat_id=%s", chat_id)
         except Exception as e:
-            logger.exception(f"[RESET] ERROR: {e}")
+            logger.exception("[RESET] ERROR: %s", e)
             raise
 
     # ------------------------------------------------------------------
@@ -111,9 +159,24 @@ class MenuController:
             await bot.delete_message(chat_id, msg_id)
             return True
         except TelegramBadRequest as e:
-            logger.debug(f"[DELETE] Failed to delete msg {msg_id}: {e}")
+            logger.debug("[DELETE] Failed to delete msg %s: %s", msg_id, e)
             return False
 
+    def delete_in_background(self, message: Message) -> None:
+        """
+        Удалить сообщение пользователя, не дожидаясь ответа Telegram.
+        Результат удаления не важен — следующий шаг FSM не ждёт лишний RTT.
+        """
+        async def _delete() -> None:
+            try:
+                await message.delete()
+            except Exception as e:
+                logger.debug("[DELETE] Failed to delete user msg %s: %s", message.message_id, e)
+
+        task = asyncio.create_task(_delete())
+        _BG_TASKS.add(task)
+        task.add_done_callback(_BG_TASKS.discard)
+
     async def _delete_previous_menu(self, message: Message) -> None:
         chat_id = message.chat.id
         old_id = await self._get_menu_id(chat_id)
@@ -147,46 +210,46 @@ class MenuController:
         chat_id = message.chat.id
         bot = message.bot
         
-        logger.info(f"[SHOW] Starting: chat_id={chat_id}, title={title}, context={menu_context}")
+        logger.debug("[SHOW] Starting: chat_id=%s, title=%s, context=%s", chat_id, title, menu_context)
         
         try:
             old_menu_id = await self._get_menu_id(chat_id)
             user_msg_id = message.message_id
-            logger.info(f"[SHOW] old_menu_id={old_menu_id}, user_msg_id={user_msg_id}")
+            logger.debug("[SHOW] old_menu_id=%s, user_msg_id=%s", old_menu_id, user_msg_id)
 
             # 1. Отправить новое меню
-            logger.info(f"[SHOW] Sending new menu...")
+            logger.debug("[SHOW] Sending new menu...")
             msg = await bot.send_message(
                 chat_id=chat_id,
                 text=title,
                 reply_markup=kb
             )
-            logger.info(f"[SHOW] Menu sent, new_msg_id={msg.message_id}")
+            logger.debug("[SHOW] Menu sent, new_msg_id=%s", msg.message_id)
             
             # 2. Сохранить новый якорь
             await self._set_menu_id(chat_id, msg.message_id)
-            logger.info(f"[SHOW] Saved new menu_id to Redis")
+            logger.debug("[SHOW] Saved new menu_id to Redis")
 
             # 3. Установить/очистить контекст меню
             if menu_context:
                 await self.set_menu_context(chat_id, menu_context)
             else:
                 await self.clear_menu_context(chat_id)
-            logger.info(f"[SHOW] Menu context updated")
+            logger.debug("[SHOW] Menu context updated")
 
             # 4. Удалить старый якорь бота
             if old_menu_id:
                 await self._safe_delete(bot, chat_id, old_menu_id)
-                logger.info(f"[SHOW] Deleted old menu")
+                logger.debug("[SHOW] Deleted old menu")
 
             # 5. Удалить сообщение пользователя
             deleted = await self._safe_delete(bot, chat_id, user_msg_id)
-            logger.info(f"[SHOW] Deleted user message: {deleted}")
+            logger.debug("[SHOW] Deleted user message: %s", deleted)
             
-            logger.info(f"[SHOW] Complete for chat_id={chat_id}")
+            logger.debug("[SHOW] Complete for chat_id=%s", chat_id)
             
         except Exception as e:
-            logger.exception(f"[SHOW] ERROR: {e}")
+            logger.exception("[SHOW] ERROR: %s", e)
             raise
 
     async def navigate(self, message: Message, kb: ReplyKeyboardMarkup) -> None:
@@ -206,12 +269,12 @@ class MenuController:
         bot = message.bot
         user_msg_id = message.message_id
 
-        logger.info(f"[SHOW_INLINE_RO] Starting: chat_id={chat_id}")
+        logger.debug("[SHOW_INLINE_RO] Starting: chat_id=%s", chat_id)
 
         # 1. Удалить предыдущие inline (если повторный вызов)
         deleted_old = await self._delete_all_inline(bot, chat_id)
         if deleted_old:
-            logger.info(f"[SHOW_INLINE_RO] Deleted {deleted_old} old inline messages")
+            logger.debug("[SHOW_INLINE_RO] Deleted %s old inline messages", deleted_old)
 
         # 2. Отправить новое inline сообщение
         inline_msg = await bot.send_message(
@@ -219,7 +282,7 @@ class MenuController:
             text=text,
             reply_markup=kb
         )
-        logger.info(f"[SHOW_INLINE_RO] Sent inline, msg_id={inline_msg.message_id}")
+        logger.debug("[SHOW_INLINE_RO] Sent inline, msg_id=%s", inline_msg.message_id)
 
         # 3. Трекать новое inline
         await self._add_inline_id(chat_id, inline_msg.message_id)
@@ -227,7 +290,7 @@ class MenuController:
         # 4. Удалить сообщение пользователя
         await self._safe_delete(bot, chat_id, user_msg_id)
         
-        logger.info(f"[SHOW_INLINE_RO] Complete")
+        logger.debug("[SHOW_INLINE_RO] Complete")
         return inline_msg
 
     # ------------------------------------------------------------------
@@ -246,12 +309,12 @@ class MenuController:
         old_menu_id = await self._get_menu_id(chat_id)
         user_msg_id = message.message_id
 
-        logger.info(f"[SHOW_INLINE_INPUT] Starting: chat_id={chat_id}")
+        logger.debug("[SHOW_INLINE_INPUT] Starting: chat_id=%s", chat_id)
 
         # 1. Удалить предыдущие inline (если повторный вызов)
         deleted_old = await self._delete_all_inline(bot, chat_id)
         if deleted_old:
-            logger.info(f"[SHOW_INLINE_INPUT] Deleted {deleted_old} old inline messages")
+            logger.debug("[SHOW_INLINE_INPUT] Deleted %s old inline messages", deleted_old)
 
         # 2. Отправить новое inline сообщение
         inline_msg = await bot.send_message(
@@ -259,7 +322,7 @@ class MenuController:
             text=text,
             reply_markup=kb
         )
-        logger.info(f"[SHOW_INLINE_INPUT] Sent inline, msg_id={inline_msg.message_id}")
+        logger.debug("[SHOW_INLINE_INPUT] Sent inline, msg_id=%s", inline_msg.message_id)
 
         # 3. Трекать новое inline
         await self._add_inline_id(chat_id, inline_msg.message_id)
@@ -273,7 +336,7 @@ class MenuController:
 
         await self._del_menu_id(chat_id)
         
-        logger.info(f"[SHOW_INLINE_INPUT] Complete")
+        logger.debug("[SHOW_INLINE_INPUT] Complete")
         return inline_msg
 
     # ------------------------------------------------------------------
@@ -303,11 +366,11 @@ class MenuController:
         chat_id = callback_message.chat.id
         bot = callback_message.bot
 
-        logger.info(f"[BACK_TO_REPLY] Starting: chat_id={chat_id}")
+        logger.debug("[BACK_TO_REPLY] Starting: chat_id=%s", chat_id)
 
         # 1. Получить старый Reply-якорь (если есть)
         old_menu_id = await self._get_menu_id(chat_id)
-        logger.info(f"[BACK_TO_REPLY] old_menu_id={old_menu_id}")
+        logger.debug("[BACK_TO_REPLY] old_menu_id=%s", old_menu_id)
 
         # 2. Отправить новое Reply меню
         msg = await bot.send_message(
@@ -315,7 +378,7 @@ class MenuController:
             text=title,
             reply_markup=kb
         )
-        logger.info(f"[BACK_TO_REPLY] Sent new menu, msg_id={msg.message_id}")
+        logger.debug("[BACK_TO_REPLY] Sent new menu, msg_id=%s", msg.message_id)
         
         # 3. Сохранить новый якорь
         await self._set_menu_id(chat_id, msg.message_id)
@@ -326,14 +389,14 @@ class MenuController:
 
         # 5. Удалить ВСЕ inline сообщения
         deleted_inline = await self._delete_all_inline(bot, chat_id)
-        logger.info(f"[BACK_TO_REPLY] Deleted {deleted_inline} inline messages")
+        logger.debug("[BACK_TO_REPLY] Deleted %s inline messages", deleted_inline)
 
         # 6. Удалить СТАРЫЙ Reply-якорь (КРИТИЧНО!)
         if old_menu_id:
             await self._safe_delete(bot, chat_id, old_menu_id)
-            logger.info(f"[BACK_TO_REPLY] Deleted old reply anchor {old_menu_id}")
+            logger.debug("[BACK_TO_REPLY] Deleted old reply anchor %s", old_menu_id)
 
-        logger.info(f"[BACK_TO_REPLY] Complete")
+        logger.debug("[BACK_TO_REPLY] Complete")
 
     # ------------------------------------------------------------------
     # Inline → Inline
@@ -346,12 +409,19 @@ class MenuController:
         kb: InlineKeyboardMarkup,
         parse_mode: str | None = None,
     ) -> None:
+        # Тот же текст + клавиатура → Telegram ответит "message is not modified"
+        sig = self._render_sig(text, kb, parse_mode)
+        if self._is_unchanged(callback_message, sig):
+            return
+
         try:
             await callback_message.edit_text(
                 text=text, reply_markup=kb, parse_mode=parse_mode,
             )
-        except TelegramBadRequest:
-            pass
+        except TelegramBadRequest as e:
+            self._after_edit_error(callback_message, sig, e)
+            return
+        self._remember_render(callback_message, sig)
 
     async def edit_inline_input(
         self,
@@ -362,10 +432,13 @@ class MenuController:
         chat_id = callback_message.chat.id
         bot = callback_message.bot
         
+        sig = self._render_sig(text, kb, None)
         try:
             await callback_message.edit_text(text=text, reply_markup=kb)
-        except TelegramBadRequest:
-            pass
+        except TelegramBadRequest as e:
+            self._after_edit_error(callback_message, sig, e)
+        else:
+            self._remember_render(callback_message, sig)
         
         old_menu_id = await self._get_menu_id(chat_id)
         if old_menu_id:
@@ -388,11 +461,11 @@ class MenuController:
         Показать ReplyKeyboard по chat_id (без объекта Message).
         Используется после callback когда оригинальный Message удалён.
         """
-        logger.info(f"[SHOW_FOR_CHAT] Starting: chat_id={chat_id}, title={title}")
+        logger.debug("[SHOW_FOR_CHAT] Starting: chat_id=%s, title=%s", chat_id, title)
         
         try:
             old_menu_id = await self._get_menu_id(chat_id)
-            logger.info(f"[SHOW_FOR_CHAT] old_menu_id={old_menu_id}")
+            logger.debug("[SHOW_FOR_CHAT] old_menu_id=%s", old_menu_id)
 
             # 1. Отправить новое меню
             msg = await bot.send_message(
@@ -400,7 +473,7 @@ class MenuController:
                 text=title,
                 reply_markup=kb
             )
-            logger.info(f"[SHOW_FOR_CHAT] Menu sent, new_msg_id={msg.message_id}")
+            logger.debug("[SHOW_FOR_CHAT] Menu sent, new_msg_id=%s", msg.message_id)
             
             # 2. Сохранить новый якорь
             await self._set_menu_id(chat_id, msg.message_id)
@@ -414,12 +487,12 @@ class MenuController:
             # 4. Удалить старый якорь бота
             if old_menu_id:
                 await self._safe_delete(bot, chat_id, old_menu_id)
-                logger.info(f"[SHOW_FOR_CHAT] Deleted old menu")
+                logger.debug("[SHOW_FOR_CHAT] Deleted old menu")
             
-            logger.info(f"[SHOW_FOR_CHAT] Complete for chat_id={chat_id}")
+            logger.debug("[SHOW_FOR_CHAT] Complete for chat_id=%s", chat_id)
             
         except Exception as e:
-            logger.exception(f"[SHOW_FOR_CHAT] ERROR: {e}")
+            logger.exception("[SHOW_FOR_CHAT] ERROR: %s", e)
             raise
 
     # ------------------------------------------------------------------
@@ -440,3 +513,36 @@ class MenuController:
         )
         await self._add_inline_id(chat_id, inline_msg.message_id)
         return inline_msg
+
+    async def edit_inline_in_flow(
+        self,
+        bot,
+        chat_id: int,
+        text: str,
+        kb: InlineKeyboardMarkup,
+    ) -> None:
+        """
+        Шаг FSM после текстового ввода: редактирует последний трекнутый inline
+        (предыдущий prompt) вместо отправки нового. Если редактировать нечего
+        или Telegram отказал — send_inline_in_flow().
+        """
+        last_ids = await self.redis.lrange(self._inline_key(chat_id), -1, -1)
+        if last_ids:
+            msg_id = int(last_ids[0])
+            try:
+                await bot.edit_message_text(
+                    text=text,
+                    chat_id=chat_id,
+                    message_id=msg_id,
+                    reply_markup=kb,
+                )
+                # Правка мимо edit_inline — сигнатура в _last_render устарела
+                self._last_render.pop((chat_id, msg_id), None)
+                return
+            except TelegramBadRequest as e:
+                # Тот же текст (например, повторный "не найдено") — prompt уже актуален
+                if "message is not modified" in str(e):
+                    return
+                logger.debug("[EDIT_IN_FLOW] Fallback to send for chat_id=%s: %s", chat_id, e)
+
+        await self.send_inline_in_flow(bot, chat_id, text, kb)
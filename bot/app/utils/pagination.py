@@ -4,11 +4,19 @@ bot/app/utils/pagination.py
 Standard nav-row builder per tg_kbrd.md §15.
 """
 
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardButton
 
 from bot.app.i18n.loader import t
 
 
+@lru_cache(maxsize=128)
+def _spacer(noop_cb: str) -> InlineKeyboardButton:
+    """Пустая кнопка-заглушка; одна на noop_cb (общий объект — не мутировать)."""
+    return InlineKeyboardButton(text=" ", callback_data=noop_cb)
+
+
 def build_nav_row(
     page: int,
     total_pages: int,
@@ -40,7 +48,7 @@ def build_nav_row(
             callback_data=page_cb.format(p=page - 1),
         ))
     else:
-        row.append(InlineKeyboardButton(text=" ", callback_data=noop_cb))
+        row.append(_spacer(noop_cb))
 
     # counter
     row.append(InlineKeyboardButton(
@@ -55,6 +63,6 @@ def build_nav_row(
             callback_data=page_cb.format(p=page + 1),
         ))
     else:
-        row.append(InlineKeyboardButton(text=" ", callback_data=noop_cb))
+        row.append(_spacer(noop_cb))
 
     return row
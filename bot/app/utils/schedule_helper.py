@@ -12,7 +12,9 @@ bot/app/utils/schedule_helper.py
 }
 """
 
+import json
 import re
+from functools import lru_cache
 from typing import Optional
 from bot.app.i18n.loader import t
 
@@ -46,6 +48,30 @@ def default_schedule() -> dict:
     return schedule
 
 
+@lru_cache(maxsize=256)
+def _parse_schedule_json(raw: str) -> dict:
+    return json.loads(raw)
+
+
+def dump_schedule(schedule: dict) -> str:
+    """dict → JSON-строка work_schedule для API (компактно, без пробелов)."""
+    return json.dumps(schedule, separators=(",", ":"))
+
+
+def parse_schedule(work_schedule: str | dict | None) -> dict:
+    """
+    work_schedule из API (JSON-строка или dict) → dict.
+
+    Разбор JSON-строки кэшируется: результат ТОЛЬКО для чтения
+    (для редактирования — copy.deepcopy).
+    """
+    if not work_schedule:
+        return {}
+    if isinstance(work_schedule, str):
+        return _parse_schedule_json(work_schedule)
+    return work_schedule
+
+
 def parse_time_input(text: str) -> Optional[dict] | str:
     """
     Парсит ввод пользователя.